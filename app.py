@@ -5,34 +5,126 @@ Streamlit interface for monitoring the arbitrage bot.
 import streamlit as st
 import pandas as pd
 from datetime import datetime
-import subprocess
+import argparse
+import io
 import os
+import traceback
+from typing import Any, Callable, Dict, Optional, Tuple
 
+from rich.console import Console
+
+from src.cli.commands import cmd_status, cmd_report, redirect_console
 from src.config import load_config
 from src.storage.ledger import Ledger
 
-st.set_page_config(
-    page_title="Project Alpha - Arbitrage Bot",
-    page_icon="📈",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
+OPPORTUNITIES_QUERY = """
+    SELECT market_id AS "Market ID", timestamp AS "Timestamp",
+           decision AS "Decision", yes_ask AS "YES Ask", no_ask AS "NO Ask",
+           sum_cost AS "Sum Cost", edge AS "Edge", reason AS "Reason"
+    FROM opportunities
+    ORDER BY timestamp DESC
+    LIMIT ? OFFSET ?
+"""
+
+TRADESETS_QUERY = """
+    SELECT id AS "ID", market_id AS "Market ID", status AS "Status",
+           yes_cost AS "YES Cost", no_cost AS "NO Cost",
+           total_cost AS "Total Cost", total_fees AS "Fees",
+           realized_pnl AS "Realized PnL", created_at AS "Created At"
+    FROM tradesets
+    ORDER BY created_at DESC
+    LIMIT ? OFFSET ?
+"""
+
+RISK_EVENTS_QUERY = """
+    SELECT event_type AS "Event Type", market_id AS "Market ID",
+           details AS "Details", created_at AS "Created At"
+    FROM risk_events
+    ORDER BY created_at DESC
+    LIMIT ? OFFSET ?
+"""
+
+PAGE_SIZES = (20, 50, 100, 500)
 
-st.markdown("""
+PAGE_CSS = """
 <style>
     .stMetric {
         background-color: #1e1e2e;
         padding: 15px;
         border-radius: 10px;
     }
-    .positive-pnl {
-        color: #00ff00;
-    }
-    .negative-pnl {
-        color: #ff0000;
-    }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+
+def _db_mtime(sqlite_path: str) -> float:
+    """Latest modification time of the ledger, including its WAL file."""
+    paths = (sqlite_path, f"{sqlite_path}-wal")
+    return max((os.path.getmtime(p) for p in paths if os.path.exists(p)), default=0.0)
+
+
+@st.cache_resource
+def get_ledger(sqlite_path: str) -> Ledger:
+    """Open the ledger once and share the connection across reruns."""
+    ledger = Ledger(sqlite_path)
+    ledger.connect()
+    return ledger
+
+
+@st.cache_data(ttl=5)
+def load_summaries(_ledger: Ledger, sqlite_path: str, mtime: float):
+    """Dashboard summaries, cached until the ledger file changes."""
+    snapshot = _ledger.get_dashboard_snapshot(hours=24)
+    return snapshot['opportunities'], snapshot['tradesets'], snapshot['risk_events']
+
+
+@st.cache_data(ttl=5)
+def load_table(
+    _ledger: Ledger,
+    sqlite_path: str,
+    mtime: float,
+    query: str,
+    params: Tuple[Any, ...] = (),
+    parse_dates: Optional[Dict[str, Dict[str, str]]] = None,
+) -> pd.DataFrame:
+    """DataFrame for a tab query, cached until the ledger file changes."""
+    return pd.read_sql_query(
+        query, _ledger._conn, params=params, parse_dates=parse_dates
+    )
+
+
+def page_controls(key: str) -> Tuple[int, int]:
+    """Render a tab's pager and return the (limit, offset) it selects."""
+    col1, col2 = st.columns(2)
+    with col1:
+        page_size = st.selectbox("Page size", PAGE_SIZES, key=f"{key}_page_size")
+    with col2:
+        page = st.number_input("Page", min_value=1, value=1, step=1, key=f"{key}_page")
+    return page_size, (page - 1) * page_size
+
+
+def run_cli_command(command: Callable[[argparse.Namespace], None], **kwargs) -> str:
+    """
+    Run a CLI command in-process and return its console output as plain
+    text, independent of the terminal the dashboard was started from.
+    """
+    output = io.StringIO()
+    with redirect_console(Console(file=output, color_system=None, width=100)):
+        try:
+            command(argparse.Namespace(**kwargs))
+        except Exception:
+            output.write(traceback.format_exc())
+    return output.getvalue()
+
+
+st.set_page_config(
+    page_title="Project Alpha - Arbitrage Bot",
+    page_icon="📈",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+st.markdown(PAGE_CSS, unsafe_allow_html=True)
 
 st.title("Project Alpha - Complete-Set Arbitrage Bot")
 st.caption("WebSocket-based prediction market arbitrage for Polymarket")
@@ -58,12 +150,13 @@ st.sidebar.write(f"**Order Size:** ${config.execution.order_size}")
 st.sidebar.write(f"**Max Daily Notional:** ${config.risk.max_daily_notional}")
 
 try:
-    ledger = Ledger(config.data.sqlite_path)
-    ledger.connect()
+    ledger = get_ledger(config.data.sqlite_path)
 except Exception as e:
     st.warning(f"No ledger database found. Run the bot first to create data.")
     ledger = None
 
+db_mtime = _db_mtime(config.data.sqlite_path)
+
 tab1, tab2, tab3, tab4, tab5 = st.tabs([
     "Dashboard", 
     "Opportunities", 
@@ -76,9 +169,9 @@ with tab1:
     st.header("Performance Dashboard")
     
     if ledger:
-        opp_summary = ledger.get_opportunities_summary()
-        ts_summary = ledger.get_tradesets_summary()
-        risk_events = ledger.get_risk_events_count(hours=24)
+        opp_summary, ts_summary, risk_events = load_summaries(
+            ledger, config.data.sqlite_path, db_mtime
+        )
         
         col1, col2, col3, col4 = st.columns(4)
         
@@ -119,22 +212,20 @@ with tab1:
         with col1:
             st.subheader("Opportunity Breakdown")
             if opp_summary['by_decision']:
-                decision_df = pd.DataFrame([
-                    {"Decision": k, "Count": v}
-                    for k, v in opp_summary['by_decision'].items()
-                ])
-                st.bar_chart(decision_df.set_index("Decision"))
+                decision_df = pd.Series(
+                    opp_summary['by_decision'], name="Count"
+                ).rename_axis("Decision").to_frame()
+                st.bar_chart(decision_df)
             else:
                 st.info("No opportunities detected yet")
         
         with col2:
             st.subheader("Tradeset Status")
             if ts_summary['by_status']:
-                status_df = pd.DataFrame([
-                    {"Status": k, "Count": v}
-                    for k, v in ts_summary['by_status'].items()
-                ])
-                st.bar_chart(status_df.set_index("Status"))
+                status_df = pd.Series(
+                    ts_summary['by_status'], name="Count"
+                ).rename_axis("Status").to_frame()
+                st.bar_chart(status_df)
             else:
                 st.info("No tradesets yet")
         
@@ -157,23 +248,16 @@ with tab2:
     st.header("Opportunities Log")
     
     if ledger:
-        cursor = ledger._conn.cursor()
-        cursor.execute("""
-            SELECT market_id, timestamp, decision, yes_ask, no_ask, 
-                   sum_cost, edge, reason
-            FROM opportunities 
-            ORDER BY timestamp DESC 
-            LIMIT 100
-        """)
-        rows = cursor.fetchall()
-        
-        if rows:
-            df = pd.DataFrame(rows, columns=[
-                "Market ID", "Timestamp", "Decision", "YES Ask", "NO Ask",
-                "Sum Cost", "Edge", "Reason"
-            ])
-            df["Timestamp"] = pd.to_datetime(df["Timestamp"], unit='s')
+        page = page_controls("opportunities")
+        df = load_table(
+            ledger, config.data.sqlite_path, db_mtime, OPPORTUNITIES_QUERY, page,
+            parse_dates={"Timestamp": {"unit": "s"}},
+        )
+
+        if not df.empty:
             st.dataframe(df, use_container_width=True)
+        elif page[1]:
+            st.info("No more rows")
         else:
             st.info("No opportunities logged yet")
     else:
@@ -183,22 +267,13 @@ with tab3:
     st.header("Tradesets")
     
     if ledger:
-        cursor = ledger._conn.cursor()
-        cursor.execute("""
-            SELECT id, market_id, status, yes_cost, no_cost, 
-                   total_cost, total_fees, realized_pnl, created_at
-            FROM tradesets 
-            ORDER BY created_at DESC 
-            LIMIT 100
-        """)
-        rows = cursor.fetchall()
-        
-        if rows:
-            df = pd.DataFrame(rows, columns=[
-                "ID", "Market ID", "Status", "YES Cost", "NO Cost",
-                "Total Cost", "Fees", "Realized PnL", "Created At"
-            ])
+        page = page_controls("tradesets")
+        df = load_table(ledger, config.data.sqlite_path, db_mtime, TRADESETS_QUERY, page)
+
+        if not df.empty:
             st.dataframe(df, use_container_width=True)
+        elif page[1]:
+            st.info("No more rows")
         else:
             st.info("No tradesets yet")
     else:
@@ -208,20 +283,13 @@ with tab4:
     st.header("Risk Events")
     
     if ledger:
-        cursor = ledger._conn.cursor()
-        cursor.execute("""
-            SELECT event_type, market_id, details, created_at
-            FROM risk_events 
-            ORDER BY created_at DESC 
-            LIMIT 100
-        """)
-        rows = cursor.fetchall()
-        
-        if rows:
-            df = pd.DataFrame(rows, columns=[
-                "Event Type", "Market ID", "Details", "Created At"
-            ])
+        page = page_controls("risk_events")
+        df = load_table(ledger, config.data.sqlite_path, db_mtime, RISK_EVENTS_QUERY, page)
+
+        if not df.empty:
             st.dataframe(df, use_container_width=True)
+        elif page[1]:
+            st.info("No more rows")
         else:
             st.info("No risk events logged")
     else:
@@ -254,29 +322,15 @@ with tab5:
     
     with col1:
         if st.button("Show Status"):
-            result = subprocess.run(
-                ["python", "-m", "src.cli.commands", "status", "-c", config_path],
-                capture_output=True,
-                text=True,
-                cwd="/home/runner/workspace"
-            )
-            st.code(result.stdout or result.stderr)
+            st.code(run_cli_command(cmd_status, config=config_path))
     
     with col2:
         if st.button("Generate Report"):
-            result = subprocess.run(
-                ["python", "-m", "src.cli.commands", "report", "-c", config_path],
-                capture_output=True,
-                text=True,
-                cwd="/home/runner/workspace"
-            )
-            st.code(result.stdout or result.stderr)
-
-if ledger:
-    ledger.close()
+            st.code(run_cli_command(cmd_report, config=config_path, days=7))
 
 st.sidebar.markdown("---")
 st.sidebar.caption(f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
 if st.sidebar.button("Refresh Data"):
+    st.cache_data.clear()
     st.rerun()
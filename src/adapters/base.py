@@ -4,10 +4,12 @@ Base VenueAdapter interface - venue-agnostic trading interface.
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional, List, Callable, Awaitable
+from typing import Optional, List, Dict, Callable, Awaitable, NamedTuple
 from decimal import Decimal
 import asyncio
 
+ZERO = Decimal("0")
+
 
 class OrderSide(Enum):
     BUY = "BUY"
@@ -30,7 +32,7 @@ class OrderStatus(Enum):
     EXPIRED = "EXPIRED"
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     order_id: str
     market_id: str
@@ -40,14 +42,14 @@ class Order:
     price: Decimal
     size: Decimal
     status: OrderStatus
-    filled_size: Decimal = Decimal("0")
+    filled_size: Decimal = ZERO
     avg_fill_price: Optional[Decimal] = None
-    fee: Decimal = Decimal("0")
+    fee: Decimal = ZERO
     created_at: Optional[float] = None
     updated_at: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Fill:
     fill_id: str
     order_id: str
@@ -57,13 +59,12 @@ class Fill:
     timestamp: float
 
 
-@dataclass
-class BookLevel:
+class BookLevel(NamedTuple):
     price: Decimal
     size: Decimal
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderBookSnapshot:
     market_id: str
     token_id: str
@@ -73,7 +74,7 @@ class OrderBookSnapshot:
     sequence: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketInfo:
     market_id: str
     condition_id: str
@@ -144,6 +145,21 @@ class VenueAdapter(ABC):
         """Get current status of an order."""
         pass
 
+    async def get_orders_status(self, order_ids: List[str]) -> Dict[str, Order]:
+        """
+        Get current status of several orders, keyed by order ID. Orders the
+        venue does not know are omitted. Adapters with a batch endpoint can
+        override this; by default the lookups run concurrently.
+        """
+        orders = await asyncio.gather(
+            *(self.get_order_status(order_id) for order_id in order_ids)
+        )
+        return {
+            order_id: order
+            for order_id, order in zip(order_ids, orders)
+            if order is not None
+        }
+
     @abstractmethod
     def set_book_update_callback(
         self, callback: Callable[[OrderBookSnapshot], Awaitable[None]]
@@ -151,6 +167,16 @@ class VenueAdapter(ABC):
         """Set callback for order book updates from WebSocket."""
         pass
 
+    def set_book_batch_callback(
+        self, callback: Callable[[List[OrderBookSnapshot]], Awaitable[None]]
+    ) -> None:
+        """
+        Set callback for order book updates that arrive together.
+        Adapters that support batching deliver through it instead of the
+        per-snapshot callback; by default updates are not batched.
+        """
+        pass
+
     @abstractmethod
     def set_fill_callback(
         self, callback: Callable[[Fill], Awaitable[None]]
@@ -158,6 +184,14 @@ class VenueAdapter(ABC):
         """Set callback for fill notifications."""
         pass
 
+    @property
+    def pushes_fills(self) -> bool:
+        """
+        Whether the fill callback is actually invoked when orders fill.
+        Callers fall back to polling order status when it is not.
+        """
+        return False
+
     @property
     @abstractmethod
     def is_connected(self) -> bool:
@@ -4,10 +4,10 @@ Simulates market data and order execution without real API calls.
 """
 import asyncio
 import random
+import time
 import uuid
 from decimal import Decimal
 from typing import Optional, List, Callable, Awaitable, Dict
-from datetime import datetime
 
 from src.adapters.base import (
     VenueAdapter,
@@ -21,6 +21,12 @@ from src.adapters.base import (
     MarketInfo,
 )
 
+ONE = Decimal("1.0")
+TICK = Decimal("0.01")
+MAX_PRICE = Decimal("0.99")
+BID_OFFSET = Decimal("0.02")
+FEE_RATE = Decimal("0.02")
+
 
 class MockVenueAdapter(VenueAdapter):
     """
@@ -33,10 +39,12 @@ class MockVenueAdapter(VenueAdapter):
         self._markets: Dict[str, MarketInfo] = {}
         self._subscribed_tokens: List[str] = []
         self._book_callback: Optional[Callable[[OrderBookSnapshot], Awaitable[None]]] = None
+        self._book_batch_callback: Optional[Callable[[List[OrderBookSnapshot]], Awaitable[None]]] = None
         self._fill_callback: Optional[Callable[[Fill], Awaitable[None]]] = None
         self._orders: Dict[str, Order] = {}
         self._ws_task: Optional[asyncio.Task] = None
         self._stop_event = asyncio.Event()
+        self._rng = random.Random()
 
         self._setup_mock_markets()
 
@@ -57,7 +65,7 @@ class MockVenueAdapter(VenueAdapter):
                 question=question,
                 yes_token_id=yes_token,
                 no_token_id=no_token,
-                min_tick_size=Decimal("0.01"),
+                min_tick_size=TICK,
                 active=True,
             )
 
@@ -86,45 +94,51 @@ class MockVenueAdapter(VenueAdapter):
                 self._subscribed_tokens.append(market.yes_token_id)
                 self._subscribed_tokens.append(market.no_token_id)
 
-        if self._book_callback:
+        if self._book_callback or self._book_batch_callback:
             self._ws_task = asyncio.create_task(self._generate_book_updates())
 
     async def _generate_book_updates(self) -> None:
         """Generate synthetic order book updates."""
-        while not self._stop_event.is_set():
-            await asyncio.sleep(random.uniform(0.5, 2.0))
+        uniform = self._rng.uniform
+        randint = self._rng.randint
+        markets = self._markets.values()
+        subscribed = self._subscribed_tokens
 
-            for market in self._markets.values():
-                if market.yes_token_id in self._subscribed_tokens:
-                    yes_mid = Decimal(str(random.uniform(0.3, 0.7)))
-                    no_mid = Decimal("1.0") - yes_mid
+        while not self._stop_event.is_set():
+            await asyncio.sleep(uniform(0.5, 2.0))
+            now = time.time()
 
-                    slippage = Decimal(str(random.uniform(-0.03, 0.05)))
-                    yes_ask = yes_mid + Decimal("0.01") + slippage
-                    no_ask = no_mid + Decimal("0.01") + slippage
+            for market in markets:
+                if market.yes_token_id in subscribed:
+                    yes_mid = Decimal(randint(300, 700)).scaleb(-3)
+                    no_mid = ONE - yes_mid
 
-                    yes_ask = max(Decimal("0.01"), min(Decimal("0.99"), yes_ask))
-                    no_ask = max(Decimal("0.01"), min(Decimal("0.99"), no_ask))
+                    slippage = Decimal(randint(-30, 50)).scaleb(-3)
+                    yes_ask = yes_mid + TICK + slippage
+                    no_ask = no_mid + TICK + slippage
 
-                    now = datetime.now().timestamp()
+                    yes_ask = max(TICK, min(MAX_PRICE, yes_ask))
+                    no_ask = max(TICK, min(MAX_PRICE, no_ask))
 
                     yes_snapshot = OrderBookSnapshot(
                         market_id=market.market_id,
                         token_id=market.yes_token_id,
-                        bids=[BookLevel(yes_ask - Decimal("0.02"), Decimal(str(random.randint(50, 500))))],
-                        asks=[BookLevel(yes_ask, Decimal(str(random.randint(50, 500))))],
+                        bids=[BookLevel(yes_ask - BID_OFFSET, Decimal(randint(50, 500)))],
+                        asks=[BookLevel(yes_ask, Decimal(randint(50, 500)))],
                         timestamp=now,
                     )
 
                     no_snapshot = OrderBookSnapshot(
                         market_id=market.market_id,
                         token_id=market.no_token_id,
-                        bids=[BookLevel(no_ask - Decimal("0.02"), Decimal(str(random.randint(50, 500))))],
-                        asks=[BookLevel(no_ask, Decimal(str(random.randint(50, 500))))],
+                        bids=[BookLevel(no_ask - BID_OFFSET, Decimal(randint(50, 500)))],
+                        asks=[BookLevel(no_ask, Decimal(randint(50, 500)))],
                         timestamp=now,
                     )
 
-                    if self._book_callback:
+                    if self._book_batch_callback:
+                        await self._book_batch_callback([yes_snapshot, no_snapshot])
+                    elif self._book_callback:
                         await self._book_callback(yes_snapshot)
                         await self._book_callback(no_snapshot)
 
@@ -134,13 +148,13 @@ class MockVenueAdapter(VenueAdapter):
         if not market:
             return None
 
-        yes_ask = Decimal(str(random.uniform(0.4, 0.6)))
+        yes_ask = Decimal(self._rng.randint(400, 600)).scaleb(-3)
         return OrderBookSnapshot(
             market_id=market_id,
             token_id=market.yes_token_id,
-            bids=[BookLevel(yes_ask - Decimal("0.02"), Decimal("100"))],
+            bids=[BookLevel(yes_ask - BID_OFFSET, Decimal("100"))],
             asks=[BookLevel(yes_ask, Decimal("100"))],
-            timestamp=datetime.now().timestamp(),
+            timestamp=time.time(),
         )
 
     async def get_market_info(self, market_id: str) -> Optional[MarketInfo]:
@@ -164,7 +178,7 @@ class MockVenueAdapter(VenueAdapter):
     ) -> Order:
         """Simulate order placement with random fill behavior."""
         order_id = f"mock-order-{uuid.uuid4().hex[:8]}"
-        now = datetime.now().timestamp()
+        now = time.time()
 
         order = Order(
             order_id=order_id,
@@ -181,14 +195,14 @@ class MockVenueAdapter(VenueAdapter):
 
         self._orders[order_id] = order
 
-        await asyncio.sleep(random.uniform(0.05, 0.2))
+        await asyncio.sleep(self._rng.uniform(0.05, 0.2))
 
-        fill_chance = random.random()
+        fill_chance = self._rng.random()
         if fill_chance > 0.1:
             order.status = OrderStatus.FILLED
             order.filled_size = size
             order.avg_fill_price = price
-            order.fee = size * price * Decimal("0.02")
+            order.fee = size * price * FEE_RATE
 
             if self._fill_callback:
                 fill = Fill(
@@ -197,19 +211,19 @@ class MockVenueAdapter(VenueAdapter):
                     price=price,
                     size=size,
                     fee=order.fee,
-                    timestamp=datetime.now().timestamp(),
+                    timestamp=time.time(),
                 )
                 await self._fill_callback(fill)
         elif fill_chance > 0.05:
-            partial_size = size * Decimal(str(random.uniform(0.3, 0.7)))
+            partial_size = size * Decimal(self._rng.randint(300, 700)).scaleb(-3)
             order.status = OrderStatus.PARTIALLY_FILLED
             order.filled_size = partial_size
             order.avg_fill_price = price
-            order.fee = partial_size * price * Decimal("0.02")
+            order.fee = partial_size * price * FEE_RATE
         else:
             order.status = OrderStatus.REJECTED
 
-        order.updated_at = datetime.now().timestamp()
+        order.updated_at = time.time()
         return order
 
     async def cancel_order(self, order_id: str) -> bool:
@@ -217,7 +231,7 @@ class MockVenueAdapter(VenueAdapter):
         order = self._orders.get(order_id)
         if order and order.status in [OrderStatus.PENDING, OrderStatus.OPEN, OrderStatus.PARTIALLY_FILLED]:
             order.status = OrderStatus.CANCELLED
-            order.updated_at = datetime.now().timestamp()
+            order.updated_at = time.time()
             return True
         return False
 
@@ -231,12 +245,23 @@ class MockVenueAdapter(VenueAdapter):
         """Set callback for order book updates."""
         self._book_callback = callback
 
+    def set_book_batch_callback(
+        self, callback: Callable[[List[OrderBookSnapshot]], Awaitable[None]]
+    ) -> None:
+        """Set callback for the YES/NO snapshot pair generated each tick."""
+        self._book_batch_callback = callback
+
     def set_fill_callback(
         self, callback: Callable[[Fill], Awaitable[None]]
     ) -> None:
         """Set callback for fill notifications."""
         self._fill_callback = callback
 
+    @property
+    def pushes_fills(self) -> bool:
+        """Mock fills are delivered through the fill callback."""
+        return True
+
     @property
     def is_connected(self) -> bool:
         """Check if mock WebSocket is connected."""
@@ -250,4 +275,4 @@ class MockVenueAdapter(VenueAdapter):
     @property
     def fee_rate(self) -> Decimal:
         """Return fee rate (2%)."""
-        return Decimal("0.02")
+        return FEE_RATE
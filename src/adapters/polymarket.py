@@ -3,9 +3,11 @@ Polymarket CLOB adapter - WebSocket market data and order execution.
 """
 import asyncio
 import json
+import sys
 import time
 from decimal import Decimal
-from typing import Optional, List, Callable, Awaitable, Dict, Any
+from functools import lru_cache
+from typing import Optional, List, Callable, Awaitable, Dict, Any, Tuple
 from datetime import datetime
 import logging
 
@@ -13,6 +15,16 @@ import aiohttp
 import websockets
 from websockets.exceptions import ConnectionClosed
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
 from src.adapters.base import (
     VenueAdapter,
     Order,
@@ -23,11 +35,21 @@ from src.adapters.base import (
     OrderBookSnapshot,
     BookLevel,
     MarketInfo,
+    ZERO,
 )
 from src.config import VenueConfig, WebSocketConfig
 
 logger = logging.getLogger(__name__)
 
+MARKET_INFO_TTL = 300.0
+DEFAULT_TICK = Decimal("0.01")
+
+
+@lru_cache(maxsize=8192, typed=True)
+def _to_decimal(value: Any) -> Decimal:
+    """Parse a book price or size; values repeat on the tick grid, so cache them."""
+    return Decimal(str(value))
+
 
 class PolymarketAdapter(VenueAdapter):
     """
@@ -51,36 +73,56 @@ class PolymarketAdapter(VenueAdapter):
         self._connected = False
         self._ws: Optional[websockets.WebSocketClientProtocol] = None
         self._book_callback: Optional[Callable[[OrderBookSnapshot], Awaitable[None]]] = None
+        self._book_batch_callback: Optional[Callable[[List[OrderBookSnapshot]], Awaitable[None]]] = None
         self._fill_callback: Optional[Callable[[Fill], Awaitable[None]]] = None
         self._ws_task: Optional[asyncio.Task] = None
         self._ping_task: Optional[asyncio.Task] = None
         self._stop_event = asyncio.Event()
         self._subscribed_tokens: List[str] = []
         self._token_to_market: Dict[str, str] = {}
+        self._market_info_cache: Dict[str, Tuple[float, MarketInfo]] = {}
         self._reconnect_delay = ws_config.reconnect_delay_initial
 
+        # last_trade_price and tick_size_change events are ignored.
+        self._event_handlers: Dict[str, Callable[[Dict[str, Any]], Awaitable[None]]] = {
+            "book": self._handle_book_event,
+            "price_change": self._handle_price_change,
+        }
+
         self._session: Optional[aiohttp.ClientSession] = None
 
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session."""
+        """Get or create the pooled aiohttp session shared by all REST calls."""
         if self._session is None or self._session.closed:
-            connector = None
-            if self.venue_config.proxy_url:
-                connector = aiohttp.TCPConnector()
-            self._session = aiohttp.ClientSession(connector=connector)
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=20,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=5, connect=2),
+            )
         return self._session
 
+    async def _open_ws(self) -> websockets.WebSocketClientProtocol:
+        """Open the market-data socket; book frames are large, compressible JSON."""
+        return await websockets.connect(
+            self.venue_config.ws_url,
+            ping_interval=None,
+            ping_timeout=None,
+            compression="deflate",
+            max_size=2**22,
+        )
+
     async def connect_ws(self) -> None:
         """Establish WebSocket connection to Polymarket CLOB."""
         self._stop_event.clear()
         self._reconnect_delay = self.ws_config.reconnect_delay_initial
 
         try:
-            self._ws = await websockets.connect(
-                self.venue_config.ws_url,
-                ping_interval=None,
-                ping_timeout=None,
-            )
+            self._ws = await self._open_ws()
             self._connected = True
             logger.info("Connected to Polymarket WebSocket")
 
@@ -140,7 +182,6 @@ class PolymarketAdapter(VenueAdapter):
 
                 message = await self._ws.recv()
                 await self._process_message(message)
-                self._reconnect_delay = self.ws_config.reconnect_delay_initial
 
             except ConnectionClosed:
                 logger.warning("WebSocket connection closed")
@@ -160,11 +201,7 @@ class PolymarketAdapter(VenueAdapter):
             await asyncio.sleep(self._reconnect_delay)
 
             try:
-                self._ws = await websockets.connect(
-                    self.venue_config.ws_url,
-                    ping_interval=None,
-                    ping_timeout=None,
-                )
+                self._ws = await self._open_ws()
                 self._connected = True
                 logger.info("Reconnected to Polymarket WebSocket")
 
@@ -172,8 +209,10 @@ class PolymarketAdapter(VenueAdapter):
                     await self._send_subscription(self._subscribed_tokens)
 
                 if self.ws_config.snapshot_on_reconnect:
-                    for market_id in set(self._token_to_market.values()):
-                        await self.get_snapshot_rest(market_id)
+                    await asyncio.gather(*(
+                        self.get_snapshot_rest(market_id)
+                        for market_id in set(self._token_to_market.values())
+                    ))
 
                 self._reconnect_delay = self.ws_config.reconnect_delay_initial
                 return
@@ -188,7 +227,7 @@ class PolymarketAdapter(VenueAdapter):
     async def _process_message(self, message: str) -> None:
         """Process incoming WebSocket message."""
         try:
-            data = json.loads(message)
+            data = _json_loads(message)
         except json.JSONDecodeError:
             logger.warning(f"Invalid JSON message: {message[:100]}")
             return
@@ -203,19 +242,10 @@ class PolymarketAdapter(VenueAdapter):
         """Process a single WebSocket message."""
         if not isinstance(data, dict):
             return
-            
-        event_type = data.get("event_type")
-
-        if event_type == "book":
-            await self._handle_book_event(data)
-        elif event_type == "price_change":
-            await self._handle_price_change(data)
-        elif event_type == "last_trade_price":
-            pass
-        elif event_type == "tick_size_change":
-            pass
-        else:
-            pass
+
+        handler = self._event_handlers.get(data.get("event_type"))
+        if handler:
+            await handler(data)
 
     async def _handle_book_event(self, data: Dict[str, Any]) -> None:
         """Handle order book update event."""
@@ -228,38 +258,37 @@ class PolymarketAdapter(VenueAdapter):
 
         market_id = self._token_to_market.get(token_id, "")
 
-        bids = []
-        for bid in data.get("bids", []):
-            if len(bid) >= 2:
-                bids.append(BookLevel(
-                    price=Decimal(str(bid[0])),
-                    size=Decimal(str(bid[1])),
-                ))
-
-        asks = []
-        for ask in data.get("asks", []):
-            if len(ask) >= 2:
-                asks.append(BookLevel(
-                    price=Decimal(str(ask[0])),
-                    size=Decimal(str(ask[1])),
-                ))
+        try:
+            bids = [
+                BookLevel(_to_decimal(price), _to_decimal(size))
+                for price, size in data.get("bids") or ()
+            ]
+            asks = [
+                BookLevel(_to_decimal(price), _to_decimal(size))
+                for price, size in data.get("asks") or ()
+            ]
+        except (ValueError, TypeError, ArithmeticError):
+            logger.warning(f"Malformed book levels for token {token_id}")
+            return
 
         snapshot = OrderBookSnapshot(
             market_id=market_id,
             token_id=token_id,
             bids=bids,
             asks=asks,
-            timestamp=data.get("timestamp", time.time()),
+            timestamp=data.get("timestamp") or time.time(),
             sequence=data.get("hash"),
         )
 
         await self._book_callback(snapshot)
 
     async def _handle_price_change(self, data: Dict[str, Any]) -> None:
-        """Handle price change event (top of book update)."""
-        if not self._book_callback:
+        """Handle price change event (top of book updates for one or more tokens)."""
+        if not self._book_callback and not self._book_batch_callback:
             return
 
+        now = time.time()
+        snapshots = []
         for change in data.get("price_changes", []):
             token_id = change.get("asset_id")
             if not token_id:
@@ -273,38 +302,49 @@ class PolymarketAdapter(VenueAdapter):
             bids = []
             if best_bid:
                 bids.append(BookLevel(
-                    price=Decimal(str(best_bid)),
-                    size=Decimal("0"),
+                    price=_to_decimal(best_bid),
+                    size=ZERO,
                 ))
 
             asks = []
             if best_ask:
                 asks.append(BookLevel(
-                    price=Decimal(str(best_ask)),
-                    size=Decimal("0"),
+                    price=_to_decimal(best_ask),
+                    size=ZERO,
                 ))
 
-            snapshot = OrderBookSnapshot(
+            snapshots.append(OrderBookSnapshot(
                 market_id=market_id,
                 token_id=token_id,
                 bids=bids,
                 asks=asks,
-                timestamp=time.time(),
-            )
+                timestamp=now,
+            ))
 
-            await self._book_callback(snapshot)
+        if not snapshots:
+            return
+
+        if self._book_batch_callback:
+            await self._book_batch_callback(snapshots)
+        else:
+            for snapshot in snapshots:
+                await self._book_callback(snapshot)
 
     async def subscribe_markets(self, market_ids: List[str]) -> None:
         """Subscribe to order book updates for specified markets."""
         token_ids = []
 
-        for market_id in market_ids:
-            market_info = await self.get_market_info(market_id)
+        market_infos = await asyncio.gather(
+            *(self.get_market_info(market_id) for market_id in market_ids)
+        )
+        for market_id, market_info in zip(market_ids, market_infos):
             if market_info:
-                token_ids.append(market_info.yes_token_id)
-                token_ids.append(market_info.no_token_id)
-                self._token_to_market[market_info.yes_token_id] = market_id
-                self._token_to_market[market_info.no_token_id] = market_id
+                yes_token_id = sys.intern(market_info.yes_token_id)
+                no_token_id = sys.intern(market_info.no_token_id)
+                token_ids.append(yes_token_id)
+                token_ids.append(no_token_id)
+                self._token_to_market[yes_token_id] = market_id
+                self._token_to_market[no_token_id] = market_id
 
         if token_ids:
             self._subscribed_tokens = token_ids
@@ -320,7 +360,7 @@ class PolymarketAdapter(VenueAdapter):
             "type": "market",
         }
 
-        await self._ws.send(json.dumps(subscription))
+        await self._ws.send(_json_dumps(subscription))
         logger.info(f"Subscribed to {len(token_ids)} tokens")
 
     async def get_snapshot_rest(self, market_id: str) -> Optional[OrderBookSnapshot]:
@@ -334,25 +374,25 @@ class PolymarketAdapter(VenueAdapter):
                 return None
 
             params = {"token_id": market_info.yes_token_id}
-            async with session.get(url, params=params) as resp:
+            async with session.get(url, params=params, proxy=self.venue_config.proxy_url) as resp:
                 if resp.status != 200:
                     logger.error(f"Failed to get book snapshot: {resp.status}")
                     return None
 
-                data = await resp.json()
+                data = await resp.json(loads=_json_loads)
 
                 bids = []
                 for bid in data.get("bids", []):
                     bids.append(BookLevel(
-                        price=Decimal(str(bid.get("price", 0))),
-                        size=Decimal(str(bid.get("size", 0))),
+                        price=_to_decimal(bid.get("price", 0)),
+                        size=_to_decimal(bid.get("size", 0)),
                     ))
 
                 asks = []
                 for ask in data.get("asks", []):
                     asks.append(BookLevel(
-                        price=Decimal(str(ask.get("price", 0))),
-                        size=Decimal(str(ask.get("size", 0))),
+                        price=_to_decimal(ask.get("price", 0)),
+                        size=_to_decimal(ask.get("size", 0)),
                     ))
 
                 return OrderBookSnapshot(
@@ -368,34 +408,46 @@ class PolymarketAdapter(VenueAdapter):
             return None
 
     async def get_market_info(self, market_id: str) -> Optional[MarketInfo]:
-        """Get market metadata including token IDs."""
+        """Get market metadata including token IDs, cached for MARKET_INFO_TTL seconds."""
+        cached = self._market_info_cache.get(market_id)
+        if cached and time.monotonic() - cached[0] < MARKET_INFO_TTL:
+            return cached[1]
+
         session = await self._get_session()
         url = f"{self.venue_config.api_url}/markets/{market_id}"
 
         try:
-            async with session.get(url) as resp:
+            async with session.get(url, proxy=self.venue_config.proxy_url) as resp:
                 if resp.status != 200:
                     return None
 
-                data = await resp.json()
+                data = await resp.json(loads=_json_loads)
 
-                tokens = data.get("tokens", [])
-                yes_token = next((t for t in tokens if t.get("outcome") == "Yes"), None)
-                no_token = next((t for t in tokens if t.get("outcome") == "No"), None)
+                yes_token = no_token = None
+                for token in data.get("tokens", []):
+                    outcome = token.get("outcome")
+                    if outcome == "Yes":
+                        yes_token = token
+                    elif outcome == "No":
+                        no_token = token
+                    if yes_token and no_token:
+                        break
 
                 if not yes_token or not no_token:
                     return None
 
-                return MarketInfo(
+                market_info = MarketInfo(
                     market_id=market_id,
                     condition_id=data.get("condition_id", ""),
                     question=data.get("question", ""),
                     yes_token_id=yes_token.get("token_id", ""),
                     no_token_id=no_token.get("token_id", ""),
-                    min_tick_size=Decimal(str(data.get("minimum_tick_size", "0.01"))),
+                    min_tick_size=_to_decimal(data.get("minimum_tick_size", DEFAULT_TICK)),
                     active=data.get("active", False),
                     end_date=data.get("end_date_iso"),
                 )
+                self._market_info_cache[market_id] = (time.monotonic(), market_info)
+                return market_info
 
         except Exception as e:
             logger.error(f"Error fetching market info: {e}")
@@ -409,12 +461,17 @@ class PolymarketAdapter(VenueAdapter):
         try:
             params = {"limit": 20, "active": "true", "closed": "false"}
             
-            async with session.get(gamma_url, params=params, timeout=aiohttp.ClientTimeout(total=30)) as resp:
+            async with session.get(
+                gamma_url,
+                params=params,
+                proxy=self.venue_config.proxy_url,
+                timeout=aiohttp.ClientTimeout(total=30),
+            ) as resp:
                 if resp.status != 200:
                     logger.warning(f"Gamma API returned {resp.status}")
                     return []
 
-                events = await resp.json()
+                events = await resp.json(loads=_json_loads)
                 markets = []
 
                 for event in events:
@@ -427,7 +484,7 @@ class PolymarketAdapter(VenueAdapter):
                                 question=m.get("question", ""),
                                 yes_token_id=clob_ids[0],
                                 no_token_id=clob_ids[1],
-                                min_tick_size=Decimal("0.01"),
+                                min_tick_size=DEFAULT_TICK,
                                 active=m.get("active", True),
                             ))
 
@@ -467,6 +524,12 @@ class PolymarketAdapter(VenueAdapter):
         """Set callback for order book updates from WebSocket."""
         self._book_callback = callback
 
+    def set_book_batch_callback(
+        self, callback: Callable[[List[OrderBookSnapshot]], Awaitable[None]]
+    ) -> None:
+        """Set callback for all top-of-book changes carried by one price_change event."""
+        self._book_batch_callback = callback
+
     def set_fill_callback(
         self, callback: Callable[[Fill], Awaitable[None]]
     ) -> None:
@@ -5,37 +5,73 @@ import asyncio
 import argparse
 import logging
 import sys
-from datetime import datetime
+import time
+from contextlib import contextmanager
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterator, Optional
 
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.live import Live
-from rich.layout import Layout
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    import json
+    _json_dumps = json.dumps
 
 from src.config import load_config
-from src.storage.ledger import Ledger
-from src.reporting.report import generate_report
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+_console: Optional["Console"] = None
+
+
+def get_console() -> "Console":
+    """Shared rich console, created on first use so `--help` skips importing rich."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+
+@contextmanager
+def redirect_console(console: "Console") -> Iterator["Console"]:
+    """Send command output to `console` for the duration of the block."""
+    global _console
+    previous, _console = _console, console
+    try:
+        yield console
+    finally:
+        _console = previous
 
 
-console = Console()
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record, timestamped in UTC from record.created."""
+
+    converter = time.gmtime
+
+    def format(self, record: logging.LogRecord) -> str:
+        return _json_dumps({
+            "timestamp": f"{self.formatTime(record, '%Y-%m-%dT%H:%M:%S')}.{int(record.msecs):03d}",
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        })
 
 
 def setup_logging(level: str, json_format: bool = False) -> None:
     """Configure logging based on config."""
     log_level = getattr(logging, level.upper(), logging.INFO)
-    
+
+    # None of the formats use thread/process fields
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     if json_format:
-        import json
-        class JsonFormatter(logging.Formatter):
-            def format(self, record):
-                return json.dumps({
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "level": record.levelname,
-                    "logger": record.name,
-                    "message": record.getMessage(),
-                })
         handler = logging.StreamHandler()
         handler.setFormatter(JsonFormatter())
         logging.root.handlers = [handler]
@@ -51,6 +87,7 @@ def setup_logging(level: str, json_format: bool = False) -> None:
 
 def cmd_run(args: argparse.Namespace) -> None:
     """Run the arbitrage bot."""
+    from rich.panel import Panel
     from src.main import run_bot
     
     config_path = args.config or "config.yaml"
@@ -63,6 +100,7 @@ def cmd_run(args: argparse.Namespace) -> None:
     
     setup_logging(config.data.log_level, config.data.log_json)
     
+    console = get_console()
     mode = "PAPER" if config.paper_mode else "LIVE"
     console.print(Panel(
         f"[bold green]Starting Arbitrage Bot[/bold green]\n"
@@ -73,13 +111,23 @@ def cmd_run(args: argparse.Namespace) -> None:
     ))
     
     try:
-        asyncio.run(run_bot(config))
+        import uvloop
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        loop_factory = None
+
+    try:
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            runner.run(run_bot(config))
     except KeyboardInterrupt:
         console.print("\n[yellow]Shutting down...[/yellow]")
 
 
 def cmd_status(args: argparse.Namespace) -> None:
     """Show current bot status."""
+    from rich.table import Table
+    from src.storage.ledger import Ledger
+
     config_path = args.config or "config.yaml"
     config = load_config(config_path)
     
@@ -108,7 +156,7 @@ def cmd_status(args: argparse.Namespace) -> None:
         table.add_row("Rejects (1h)", str(risk_events.get('reject', 0)))
         table.add_row("WS Disconnects (1h)", str(risk_events.get('ws_disconnect', 0)))
         
-        console.print(table)
+        get_console().print(table)
         
     finally:
         ledger.close()
@@ -116,6 +164,9 @@ def cmd_status(args: argparse.Namespace) -> None:
 
 def cmd_report(args: argparse.Namespace) -> None:
     """Generate a performance report."""
+    from src.reporting.report import generate_report
+    from src.storage.ledger import Ledger
+
     config_path = args.config or "config.yaml"
     config = load_config(config_path)
     
@@ -124,19 +175,21 @@ def cmd_report(args: argparse.Namespace) -> None:
     
     try:
         report = generate_report(ledger, days=args.days)
-        console.print(report)
+        get_console().print(report)
     finally:
         ledger.close()
 
 
 def cmd_halt(args: argparse.Namespace) -> None:
     """Halt trading (soft stop)."""
+    console = get_console()
     console.print("[red]Halt command - would stop trading in a running bot[/red]")
     console.print("Note: This requires the bot to be running. Use Ctrl+C to stop the bot process.")
 
 
 def cmd_resume(args: argparse.Namespace) -> None:
     """Resume trading after halt."""
+    console = get_console()
     console.print("[green]Resume command - would resume trading in a running bot[/green]")
     console.print("Note: This requires the bot to be running with a halt state.")
 
@@ -4,11 +4,17 @@ Loads from config.yaml and environment variables.
 """
 import os
 import yaml
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from decimal import Decimal
-from typing import List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
 from pathlib import Path
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 @dataclass
 class StrategyConfig:
@@ -72,6 +78,41 @@ class Config:
     paper_mode: bool = True
 
 
+_SECTIONS = (
+    ("venue", VenueConfig),
+    ("strategy", StrategyConfig),
+    ("execution", ExecutionConfig),
+    ("risk", RiskConfig),
+    ("data", DataConfig),
+    ("websocket", WebSocketConfig),
+)
+
+
+def _build_section(section_cls: type, raw: Dict[str, Any]) -> Any:
+    """
+    Instantiate a config section from its YAML mapping. Missing keys keep
+    the dataclass defaults; Decimal fields are parsed via str().
+    """
+    kwargs = {}
+    for f in fields(section_cls):
+        if f.name in raw:
+            value = raw[f.name]
+            if f.type is Decimal:
+                value = Decimal(str(value))
+            kwargs[f.name] = value
+    return section_cls(**kwargs)
+
+
+@lru_cache(maxsize=8)
+def _read_yaml(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Parse a YAML config file. Keyed on mtime so edits are picked up;
+    callers must treat the result as read-only.
+    """
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_YamlLoader) or {}
+
+
 def load_config(config_path: str = "config.yaml") -> Config:
     """
     Load configuration from YAML file and environment variables.
@@ -79,68 +120,17 @@ def load_config(config_path: str = "config.yaml") -> Config:
     """
     config = Config()
 
-    if Path(config_path).exists():
-        with open(config_path, 'r') as f:
-            yaml_config = yaml.safe_load(f) or {}
+    path = Path(config_path)
+    if path.exists():
+        yaml_config = _read_yaml(os.path.realpath(path), path.stat().st_mtime_ns)
 
-        if 'venue' in yaml_config:
-            v = yaml_config['venue']
-            config.venue = VenueConfig(
-                name=v.get('name', config.venue.name),
-                api_url=v.get('api_url', config.venue.api_url),
-                ws_url=v.get('ws_url', config.venue.ws_url),
-                proxy_url=v.get('proxy_url'),
-            )
+        for name, section_cls in _SECTIONS:
+            raw = yaml_config.get(name)
+            if raw:
+                setattr(config, name, _build_section(section_cls, raw))
 
         if 'markets' in yaml_config:
-            config.markets = yaml_config['markets']
-
-        if 'strategy' in yaml_config:
-            s = yaml_config['strategy']
-            config.strategy = StrategyConfig(
-                min_edge=Decimal(str(s.get('min_edge', config.strategy.min_edge))),
-                cost_buffer=Decimal(str(s.get('cost_buffer', config.strategy.cost_buffer))),
-                min_depth=Decimal(str(s.get('min_depth', config.strategy.min_depth))),
-            )
-
-        if 'execution' in yaml_config:
-            e = yaml_config['execution']
-            config.execution = ExecutionConfig(
-                order_size=Decimal(str(e.get('order_size', config.execution.order_size))),
-                max_attempts_per_round=e.get('max_attempts_per_round', config.execution.max_attempts_per_round),
-                order_timeout_seconds=e.get('order_timeout_seconds', config.execution.order_timeout_seconds),
-                max_inflight_seconds=e.get('max_inflight_seconds', config.execution.max_inflight_seconds),
-                cooldown_seconds=e.get('cooldown_seconds', config.execution.cooldown_seconds),
-            )
-
-        if 'risk' in yaml_config:
-            r = yaml_config['risk']
-            config.risk = RiskConfig(
-                max_daily_notional=Decimal(str(r.get('max_daily_notional', config.risk.max_daily_notional))),
-                max_open_positions=r.get('max_open_positions', config.risk.max_open_positions),
-                halt_on_partial_fill=r.get('halt_on_partial_fill', config.risk.halt_on_partial_fill),
-                max_partial_fills_per_hour=r.get('max_partial_fills_per_hour', config.risk.max_partial_fills_per_hour),
-                max_rejects_per_hour=r.get('max_rejects_per_hour', config.risk.max_rejects_per_hour),
-                max_ws_disconnects_per_hour=r.get('max_ws_disconnects_per_hour', config.risk.max_ws_disconnects_per_hour),
-            )
-
-        if 'data' in yaml_config:
-            d = yaml_config['data']
-            config.data = DataConfig(
-                sqlite_path=d.get('sqlite_path', config.data.sqlite_path),
-                log_level=d.get('log_level', config.data.log_level),
-                log_json=d.get('log_json', config.data.log_json),
-            )
-
-        if 'websocket' in yaml_config:
-            w = yaml_config['websocket']
-            config.websocket = WebSocketConfig(
-                reconnect_delay_initial=w.get('reconnect_delay_initial', config.websocket.reconnect_delay_initial),
-                reconnect_delay_max=w.get('reconnect_delay_max', config.websocket.reconnect_delay_max),
-                reconnect_backoff_factor=w.get('reconnect_backoff_factor', config.websocket.reconnect_backoff_factor),
-                heartbeat_interval=w.get('heartbeat_interval', config.websocket.heartbeat_interval),
-                snapshot_on_reconnect=w.get('snapshot_on_reconnect', config.websocket.snapshot_on_reconnect),
-            )
+            config.markets = list(yaml_config['markets'] or ())
 
         config.paper_mode = yaml_config.get('paper_mode', config.paper_mode)
 
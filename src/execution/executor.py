@@ -4,13 +4,14 @@ Handles order placement, partial-fill protection, and risk management.
 """
 import asyncio
 import uuid
+from dataclasses import dataclass
 from decimal import Decimal
 from typing import Optional, Dict
-from datetime import datetime
+import time
 from enum import Enum
 import logging
 
-from src.adapters.base import VenueAdapter, Order, OrderSide, OrderType, OrderStatus
+from src.adapters.base import VenueAdapter, Order, Fill, OrderSide, OrderType, OrderStatus
 from src.strategy.signal_engine import SignalEngine, TradeSignal
 from src.storage.ledger import Ledger
 from src.config import ExecutionConfig, RiskConfig
@@ -18,6 +19,18 @@ from src.marketdata.orderbook_state import MarketBook
 
 logger = logging.getLogger(__name__)
 
+# Order status poll cadence while waiting on fills: tight when the venue
+# doesn't push fills, relaxed when the fill callback wakes us anyway.
+FILL_POLL_INTERVAL = 0.5
+FILL_PUSH_POLL_INTERVAL = 1.0
+
+# Ledger column values for the only order shape we place
+_SIDE_BUY = OrderSide.BUY.value
+_TYPE_LIMIT = OrderType.LIMIT.value
+_STATUS_FILLED = OrderStatus.FILLED.value
+
+_CANCELABLE = frozenset({OrderStatus.OPEN, OrderStatus.PENDING, OrderStatus.PARTIALLY_FILLED})
+
 
 class ExecutionState(Enum):
     IDLE = "IDLE"
@@ -30,20 +43,13 @@ class ExecutionState(Enum):
     COOLDOWN = "COOLDOWN"
 
 
+@dataclass(slots=True)
 class ExecutionResult:
-    def __init__(
-        self,
-        success: bool,
-        tradeset_id: Optional[int] = None,
-        yes_order: Optional[Order] = None,
-        no_order: Optional[Order] = None,
-        error: Optional[str] = None,
-    ):
-        self.success = success
-        self.tradeset_id = tradeset_id
-        self.yes_order = yes_order
-        self.no_order = no_order
-        self.error = error
+    success: bool
+    tradeset_id: Optional[int] = None
+    yes_order: Optional[Order] = None
+    no_order: Optional[Order] = None
+    error: Optional[str] = None
 
 
 class ExecutionEngine:
@@ -74,6 +80,18 @@ class ExecutionEngine:
         self._halted = False
         self._daily_notional = Decimal("0")
         self._open_positions = 0
+        self._fill_events: Dict[str, asyncio.Event] = {}
+
+        self._max_daily_notional = risk_config.max_daily_notional
+        self._max_open_positions = risk_config.max_open_positions
+        self._max_partial_fills = risk_config.max_partial_fills_per_hour
+        self._max_rejects = risk_config.max_rejects_per_hour
+        self._max_ws_disconnects = risk_config.max_ws_disconnects_per_hour
+
+        self._fill_poll_interval = (
+            FILL_PUSH_POLL_INTERVAL if adapter.pushes_fills else FILL_POLL_INTERVAL
+        )
+        adapter.set_fill_callback(self._on_fill)
 
     @property
     def is_halted(self) -> bool:
@@ -94,25 +112,36 @@ class ExecutionEngine:
         """Get current execution state for a market."""
         return self._state.get(market_id, ExecutionState.IDLE)
 
+    def _end_cooldown(self, market_id: str) -> None:
+        """Return a market to IDLE once its cooldown has elapsed."""
+        if self._state.get(market_id) == ExecutionState.COOLDOWN:
+            self._state[market_id] = ExecutionState.IDLE
+
+    async def _on_fill(self, fill: Fill) -> None:
+        """Wake any live execution waiting on the filled order."""
+        event = self._fill_events.get(fill.order_id)
+        if event:
+            event.set()
+
     def _check_risk_limits(self, order_size: Decimal, price: Decimal) -> Optional[str]:
         """Check if trade would violate risk limits."""
-        notional = order_size * price * 2
+        projected_notional = self._daily_notional + order_size * price * 2
 
-        if self._daily_notional + notional > self.risk_config.max_daily_notional:
-            return f"Would exceed daily notional limit ({self._daily_notional + notional} > {self.risk_config.max_daily_notional})"
+        if projected_notional > self._max_daily_notional:
+            return f"Would exceed daily notional limit ({projected_notional} > {self._max_daily_notional})"
 
-        if self._open_positions >= self.risk_config.max_open_positions:
+        if self._open_positions >= self._max_open_positions:
             return f"At max open positions ({self._open_positions})"
 
         risk_events = self.ledger.get_risk_events_count(hours=1)
         
-        if risk_events.get("partial_fill", 0) >= self.risk_config.max_partial_fills_per_hour:
+        if risk_events.get("partial_fill", 0) >= self._max_partial_fills:
             return "Too many partial fills in the last hour"
 
-        if risk_events.get("reject", 0) >= self.risk_config.max_rejects_per_hour:
+        if risk_events.get("reject", 0) >= self._max_rejects:
             return "Too many order rejects in the last hour"
 
-        if risk_events.get("ws_disconnect", 0) >= self.risk_config.max_ws_disconnects_per_hour:
+        if risk_events.get("ws_disconnect", 0) >= self._max_ws_disconnects:
             return "Too many WebSocket disconnects in the last hour"
 
         return None
@@ -121,11 +150,13 @@ class ExecutionEngine:
         self,
         signal: TradeSignal,
         market: MarketBook,
+        return_orders: bool = True,
     ) -> ExecutionResult:
         """
         Execute a complete-set trade based on a signal.
         
-        In paper mode, simulates execution without placing real orders.
+        In paper mode, simulates execution without placing real orders;
+        pass return_orders=False to skip building the simulated Order objects.
         """
         market_id = signal.market_id
 
@@ -155,7 +186,8 @@ class ExecutionEngine:
 
             if self.paper_mode:
                 result = await self._execute_paper(
-                    market_id, market, signal, order_size, tradeset_id
+                    market_id, market, signal, order_size, tradeset_id,
+                    return_orders,
                 )
             else:
                 result = await self._execute_live(
@@ -174,18 +206,19 @@ class ExecutionEngine:
         except Exception as e:
             logger.error(f"Execution error for {market_id}: {e}")
             self._state[market_id] = ExecutionState.FAILED
-            self.ledger.update_tradeset(tradeset_id, status="failed")
-            self.ledger.log_risk_event("execution_error", market_id, {"error": str(e)})
+            with self.ledger.transaction():
+                self.ledger.update_tradeset(tradeset_id, status="failed")
+                self.ledger.log_risk_event("execution_error", market_id, {"error": str(e)})
             return ExecutionResult(success=False, tradeset_id=tradeset_id, error=str(e))
 
         finally:
+            cooldown_seconds = self.execution_config.cooldown_seconds
             self.signal_engine.clear_in_flight(market_id)
-            self.signal_engine.set_cooldown(
-                market_id, self.execution_config.cooldown_seconds
-            )
+            self.signal_engine.set_cooldown(market_id, cooldown_seconds)
             self._state[market_id] = ExecutionState.COOLDOWN
-            await asyncio.sleep(0.1)
-            self._state[market_id] = ExecutionState.IDLE
+            asyncio.get_running_loop().call_later(
+                cooldown_seconds, self._end_cooldown, market_id
+            )
 
     async def _execute_paper(
         self,
@@ -194,17 +227,57 @@ class ExecutionEngine:
         signal: TradeSignal,
         order_size: Decimal,
         tradeset_id: int,
+        return_orders: bool = True,
     ) -> ExecutionResult:
         """Execute in paper mode - simulate without real orders."""
-        now = datetime.now().timestamp()
+        now = time.time()
 
         yes_order_id = f"paper-yes-{uuid.uuid4().hex[:8]}"
         no_order_id = f"paper-no-{uuid.uuid4().hex[:8]}"
+        yes_token_id = market.yes_token.token_id
+        no_token_id = market.no_token.token_id
+
+        fee_rate = self.adapter.fee_rate
+        yes_cost = order_size * signal.yes_ask
+        no_cost = order_size * signal.no_ask
+        yes_fee = yes_cost * fee_rate
+        no_fee = no_cost * fee_rate
+        total_fees = yes_fee + no_fee
+
+        expected_payout = order_size
+        theoretical_pnl = expected_payout - yes_cost - no_cost - total_fees
+
+        with self.ledger.transaction():
+            self.ledger.log_orders([
+                (yes_order_id, tradeset_id, market_id, yes_token_id,
+                 _SIDE_BUY, _TYPE_LIMIT, signal.yes_ask, order_size, _STATUS_FILLED),
+                (no_order_id, tradeset_id, market_id, no_token_id,
+                 _SIDE_BUY, _TYPE_LIMIT, signal.no_ask, order_size, _STATUS_FILLED),
+            ])
+            self.ledger.update_tradeset(
+                tradeset_id,
+                status="filled",
+                yes_order_id=yes_order_id,
+                no_order_id=no_order_id,
+                yes_cost=yes_cost,
+                no_cost=no_cost,
+                total_fees=total_fees,
+                realized_pnl=theoretical_pnl,
+            )
+
+        logger.info(
+            f"[PAPER] Complete-set executed for {market_id}: "
+            f"YES@{signal.yes_ask} + NO@{signal.no_ask} = {signal.sum_cost}, "
+            f"edge={signal.edge:.4f}, theoretical_pnl={theoretical_pnl:.4f}"
+        )
+
+        if not return_orders:
+            return ExecutionResult(success=True, tradeset_id=tradeset_id)
 
         yes_order = Order(
             order_id=yes_order_id,
             market_id=market_id,
-            token_id=market.yes_token.token_id,
+            token_id=yes_token_id,
             side=OrderSide.BUY,
             order_type=OrderType.LIMIT,
             price=signal.yes_ask,
@@ -212,7 +285,7 @@ class ExecutionEngine:
             status=OrderStatus.FILLED,
             filled_size=order_size,
             avg_fill_price=signal.yes_ask,
-            fee=order_size * signal.yes_ask * self.adapter.fee_rate,
+            fee=yes_fee,
             created_at=now,
             updated_at=now,
         )
@@ -220,7 +293,7 @@ class ExecutionEngine:
         no_order = Order(
             order_id=no_order_id,
             market_id=market_id,
-            token_id=market.no_token.token_id,
+            token_id=no_token_id,
             side=OrderSide.BUY,
             order_type=OrderType.LIMIT,
             price=signal.no_ask,
@@ -228,44 +301,11 @@ class ExecutionEngine:
             status=OrderStatus.FILLED,
             filled_size=order_size,
             avg_fill_price=signal.no_ask,
-            fee=order_size * signal.no_ask * self.adapter.fee_rate,
+            fee=no_fee,
             created_at=now,
             updated_at=now,
         )
 
-        self.ledger.log_order(
-            yes_order_id, tradeset_id, market_id, market.yes_token.token_id,
-            "BUY", "LIMIT", signal.yes_ask, order_size, "FILLED"
-        )
-        self.ledger.log_order(
-            no_order_id, tradeset_id, market_id, market.no_token.token_id,
-            "BUY", "LIMIT", signal.no_ask, order_size, "FILLED"
-        )
-
-        yes_cost = order_size * signal.yes_ask
-        no_cost = order_size * signal.no_ask
-        total_fees = yes_order.fee + no_order.fee
-
-        expected_payout = order_size * Decimal("1.0")
-        theoretical_pnl = expected_payout - yes_cost - no_cost - total_fees
-
-        self.ledger.update_tradeset(
-            tradeset_id,
-            status="filled",
-            yes_order_id=yes_order_id,
-            no_order_id=no_order_id,
-            yes_cost=yes_cost,
-            no_cost=no_cost,
-            total_fees=total_fees,
-            realized_pnl=theoretical_pnl,
-        )
-
-        logger.info(
-            f"[PAPER] Complete-set executed for {market_id}: "
-            f"YES@{signal.yes_ask} + NO@{signal.no_ask} = {signal.sum_cost}, "
-            f"edge={signal.edge:.4f}, theoretical_pnl={theoretical_pnl:.4f}"
-        )
-
         return ExecutionResult(
             success=True,
             tradeset_id=tradeset_id,
@@ -282,128 +322,153 @@ class ExecutionEngine:
         tradeset_id: int,
     ) -> ExecutionResult:
         """Execute live orders with partial-fill protection."""
-        try:
-            yes_order = await self.adapter.place_order(
+        yes_order, no_order = await asyncio.gather(
+            self.adapter.place_order(
                 market_id=market_id,
                 token_id=market.yes_token.token_id,
                 side=OrderSide.BUY,
                 order_type=OrderType.LIMIT,
                 price=signal.yes_ask,
                 size=order_size,
-            )
-
-            self.ledger.log_order(
-                yes_order.order_id, tradeset_id, market_id, market.yes_token.token_id,
-                "BUY", "LIMIT", signal.yes_ask, order_size, yes_order.status.value
-            )
-
-            if yes_order.status == OrderStatus.REJECTED:
-                self.ledger.log_risk_event("reject", market_id, {"side": "YES"})
-                self.ledger.update_tradeset(tradeset_id, status="failed")
-                return ExecutionResult(
-                    success=False,
-                    tradeset_id=tradeset_id,
-                    yes_order=yes_order,
-                    error="YES order rejected",
-                )
-
-        except Exception as e:
-            logger.error(f"Failed to place YES order: {e}")
-            self.ledger.update_tradeset(tradeset_id, status="failed")
-            return ExecutionResult(success=False, tradeset_id=tradeset_id, error=str(e))
-
-        try:
-            no_order = await self.adapter.place_order(
+            ),
+            self.adapter.place_order(
                 market_id=market_id,
                 token_id=market.no_token.token_id,
                 side=OrderSide.BUY,
                 order_type=OrderType.LIMIT,
                 price=signal.no_ask,
                 size=order_size,
-            )
+            ),
+            return_exceptions=True,
+        )
 
-            self.ledger.log_order(
-                no_order.order_id, tradeset_id, market_id, market.no_token.token_id,
-                "BUY", "LIMIT", signal.no_ask, order_size, no_order.status.value
-            )
+        legs = (
+            ("YES", yes_order, market.yes_token.token_id, signal.yes_ask),
+            ("NO", no_order, market.no_token.token_id, signal.no_ask),
+        )
+        errors: Dict[str, str] = {}
+
+        with self.ledger.transaction():
+            self.ledger.log_orders([
+                (order.order_id, tradeset_id, market_id, token_id,
+                 _SIDE_BUY, _TYPE_LIMIT, price, order_size, order.status.value)
+                for _, order, token_id, price in legs
+                if isinstance(order, Order)
+            ])
+
+            for side, order, _, _ in legs:
+                if not isinstance(order, Order):
+                    logger.error(f"Failed to place {side} order: {order}")
+                    errors[side] = str(order)
+                elif order.status == OrderStatus.REJECTED:
+                    self.ledger.log_risk_event("reject", market_id, {"side": side})
+                    errors[side] = f"{side} order rejected"
+
+            if len(errors) == len(legs):
+                self.ledger.update_tradeset(tradeset_id, status="failed")
 
-            if no_order.status == OrderStatus.REJECTED:
-                self.ledger.log_risk_event("reject", market_id, {"side": "NO"})
-                await self._handle_partial_fill(market_id, tradeset_id, yes_order, None)
-                return ExecutionResult(
-                    success=False,
-                    tradeset_id=tradeset_id,
-                    yes_order=yes_order,
-                    no_order=no_order,
-                    error="NO order rejected, YES leg exposed",
-                )
+        if not isinstance(yes_order, Order):
+            yes_order = None
+        if not isinstance(no_order, Order):
+            no_order = None
 
-        except Exception as e:
-            logger.error(f"Failed to place NO order: {e}")
-            await self._handle_partial_fill(market_id, tradeset_id, yes_order, None)
+        if len(errors) == len(legs):
             return ExecutionResult(
                 success=False,
                 tradeset_id=tradeset_id,
                 yes_order=yes_order,
-                error=str(e),
+                no_order=no_order,
+                error="; ".join(errors.values()),
             )
 
-        self._state[market_id] = ExecutionState.WAITING_FILLS
-
-        timeout = self.execution_config.order_timeout_seconds
-        start_time = asyncio.get_event_loop().time()
-
-        while asyncio.get_event_loop().time() - start_time < timeout:
-            await asyncio.sleep(0.5)
-
-            yes_status = await self.adapter.get_order_status(yes_order.order_id)
-            no_status = await self.adapter.get_order_status(no_order.order_id)
-
-            if yes_status:
-                yes_order = yes_status
-            if no_status:
-                no_order = no_status
-
-            yes_filled = yes_order.status == OrderStatus.FILLED
-            no_filled = no_order.status == OrderStatus.FILLED
-
-            if yes_filled and no_filled:
-                yes_cost = yes_order.filled_size * yes_order.avg_fill_price
-                no_cost = no_order.filled_size * no_order.avg_fill_price
-                total_fees = yes_order.fee + no_order.fee
+        if errors:
+            failed_side, error = next(iter(errors.items()))
+            exposed_side = "NO" if failed_side == "YES" else "YES"
+            await self._handle_partial_fill(
+                market_id,
+                tradeset_id,
+                yes_order if failed_side == "NO" else None,
+                no_order if failed_side == "YES" else None,
+            )
+            return ExecutionResult(
+                success=False,
+                tradeset_id=tradeset_id,
+                yes_order=yes_order,
+                no_order=no_order,
+                error=f"{error}, {exposed_side} leg exposed",
+            )
 
-                expected_payout = min(yes_order.filled_size, no_order.filled_size) * Decimal("1.0")
-                realized_pnl = expected_payout - yes_cost - no_cost - total_fees
+        self._state[market_id] = ExecutionState.WAITING_FILLS
 
-                self.ledger.update_tradeset(
-                    tradeset_id,
-                    status="filled",
-                    yes_order_id=yes_order.order_id,
-                    no_order_id=no_order.order_id,
-                    yes_cost=yes_cost,
-                    no_cost=no_cost,
-                    total_fees=total_fees,
-                    realized_pnl=realized_pnl,
-                )
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.execution_config.order_timeout_seconds
 
-                logger.info(f"Complete-set filled for {market_id}, realized_pnl={realized_pnl:.4f}")
-                return ExecutionResult(
-                    success=True,
-                    tradeset_id=tradeset_id,
-                    yes_order=yes_order,
-                    no_order=no_order,
-                )
+        fill_event = asyncio.Event()
+        self._fill_events[yes_order.order_id] = fill_event
+        self._fill_events[no_order.order_id] = fill_event
 
-            if yes_order.status == OrderStatus.PARTIALLY_FILLED or no_order.status == OrderStatus.PARTIALLY_FILLED:
-                self.ledger.log_risk_event("partial_fill", market_id)
-                await self._handle_partial_fill(market_id, tradeset_id, yes_order, no_order)
-                return ExecutionResult(
-                    success=False,
-                    tradeset_id=tradeset_id,
-                    yes_order=yes_order,
-                    no_order=no_order,
-                    error="Partial fill detected",
+        try:
+            while True:
+                yes_filled = yes_order.status == OrderStatus.FILLED
+                no_filled = no_order.status == OrderStatus.FILLED
+
+                if yes_filled and no_filled:
+                    yes_cost = yes_order.filled_size * yes_order.avg_fill_price
+                    no_cost = no_order.filled_size * no_order.avg_fill_price
+                    total_fees = yes_order.fee + no_order.fee
+
+                    expected_payout = min(yes_order.filled_size, no_order.filled_size)
+                    realized_pnl = expected_payout - yes_cost - no_cost - total_fees
+
+                    self.ledger.update_tradeset(
+                        tradeset_id,
+                        status="filled",
+                        yes_order_id=yes_order.order_id,
+                        no_order_id=no_order.order_id,
+                        yes_cost=yes_cost,
+                        no_cost=no_cost,
+                        total_fees=total_fees,
+                        realized_pnl=realized_pnl,
+                    )
+
+                    logger.info(f"Complete-set filled for {market_id}, realized_pnl={realized_pnl:.4f}")
+                    return ExecutionResult(
+                        success=True,
+                        tradeset_id=tradeset_id,
+                        yes_order=yes_order,
+                        no_order=no_order,
+                    )
+
+                if yes_order.status == OrderStatus.PARTIALLY_FILLED or no_order.status == OrderStatus.PARTIALLY_FILLED:
+                    self.ledger.log_risk_event("partial_fill", market_id)
+                    await self._handle_partial_fill(market_id, tradeset_id, yes_order, no_order)
+                    return ExecutionResult(
+                        success=False,
+                        tradeset_id=tradeset_id,
+                        yes_order=yes_order,
+                        no_order=no_order,
+                        error="Partial fill detected",
+                    )
+
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+
+                # Wake on a fill notification, or poll anyway in case the venue doesn't push one.
+                try:
+                    await asyncio.wait_for(fill_event.wait(), min(remaining, self._fill_poll_interval))
+                except asyncio.TimeoutError:
+                    pass
+                fill_event.clear()
+
+                statuses = await self.adapter.get_orders_status(
+                    [yes_order.order_id, no_order.order_id]
                 )
+                yes_order = statuses.get(yes_order.order_id, yes_order)
+                no_order = statuses.get(no_order.order_id, no_order)
+        finally:
+            self._fill_events.pop(yes_order.order_id, None)
+            self._fill_events.pop(no_order.order_id, None)
 
         logger.warning(f"Order timeout for {market_id}")
         await self._handle_partial_fill(market_id, tradeset_id, yes_order, no_order)
@@ -426,14 +491,14 @@ class ExecutionEngine:
         self._state[market_id] = ExecutionState.PARTIAL_FILL_PROTECT
         logger.warning(f"Partial fill protection triggered for {market_id}")
 
-        if yes_order and yes_order.status in [OrderStatus.OPEN, OrderStatus.PENDING, OrderStatus.PARTIALLY_FILLED]:
+        if yes_order and yes_order.status in _CANCELABLE:
             try:
                 await self.adapter.cancel_order(yes_order.order_id)
                 logger.info(f"Cancelled YES order {yes_order.order_id}")
             except Exception as e:
                 logger.error(f"Failed to cancel YES order: {e}")
 
-        if no_order and no_order.status in [OrderStatus.OPEN, OrderStatus.PENDING, OrderStatus.PARTIALLY_FILLED]:
+        if no_order and no_order.status in _CANCELABLE:
             try:
                 await self.adapter.cancel_order(no_order.order_id)
                 logger.info(f"Cancelled NO order {no_order.order_id}")
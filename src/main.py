@@ -4,7 +4,8 @@ Main entry point for the arbitrage bot.
 import asyncio
 import logging
 import signal
-from typing import Optional
+import sqlite3
+from typing import List, Optional
 
 from src.config import Config
 from src.adapters.base import VenueAdapter, OrderBookSnapshot
@@ -14,7 +15,7 @@ from src.marketdata.orderbook_state import OrderBookState
 from src.strategy.signal_engine import SignalEngine
 from src.execution.executor import ExecutionEngine
 from src.execution.risk import KillSwitch
-from src.storage.ledger import Ledger
+from src.storage.ledger import Ledger, OPPORTUNITY_FLUSH_SECONDS
 
 logger = logging.getLogger(__name__)
 
@@ -36,12 +37,14 @@ class ArbBot:
         self.kill_switch: Optional[KillSwitch] = None
         self._running = False
         self._shutdown_event = asyncio.Event()
+        self._flush_task: Optional[asyncio.Task] = None
 
     async def start(self) -> None:
         """Initialize and start the bot."""
         logger.info(f"Starting ArbBot in {'PAPER' if self.config.paper_mode else 'LIVE'} mode")
 
         self.ledger.connect()
+        self._flush_task = asyncio.create_task(self._flush_ledger())
 
         if self.config.venue.name == "mock":
             self.adapter = MockVenueAdapter()
@@ -74,6 +77,7 @@ class ArbBot:
         )
 
         self.adapter.set_book_update_callback(self._on_book_update)
+        self.adapter.set_book_batch_callback(self._on_book_batch)
 
         await self.adapter.connect_ws()
         logger.info("WebSocket connected")
@@ -82,7 +86,7 @@ class ArbBot:
             for market_id in self.config.markets:
                 market_info = await self.adapter.get_market_info(market_id)
                 if market_info:
-                    await self.order_book.register_market(
+                    self.order_book.register_market(
                         market_id=market_info.market_id,
                         question=market_info.question,
                         yes_token_id=market_info.yes_token_id,
@@ -96,7 +100,7 @@ class ArbBot:
         else:
             markets = await self.adapter.list_markets(active_only=True)
             for market_info in markets[:10]:
-                await self.order_book.register_market(
+                self.order_book.register_market(
                     market_id=market_info.market_id,
                     question=market_info.question,
                     yes_token_id=market_info.yes_token_id,
@@ -117,36 +121,71 @@ class ArbBot:
         if self.adapter:
             await self.adapter.disconnect_ws()
 
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+
         if self.ledger:
             self.ledger.close()
 
         logger.info("Bot stopped")
 
+    async def _flush_ledger(self) -> None:
+        """Bound how long buffered opportunities wait when markets are quiet."""
+        while True:
+            await asyncio.sleep(OPPORTUNITY_FLUSH_SECONDS)
+            try:
+                self.ledger.flush()
+            except sqlite3.Error as e:
+                logger.error(f"Ledger flush failed: {e}")
+
     async def _on_book_update(self, snapshot: OrderBookSnapshot) -> None:
         """Handle incoming order book updates."""
-        market_id = await self.order_book.update_from_snapshot(snapshot)
+        market_id = self.order_book.update_from_snapshot(snapshot)
         if not market_id:
             return
 
+        await self._evaluate_markets([market_id])
+
+    async def _on_book_batch(self, snapshots: List[OrderBookSnapshot]) -> None:
+        """Apply a batch of book updates, then evaluate each touched market once."""
+        market_ids: List[str] = []
+        for snapshot in snapshots:
+            market_id = self.order_book.update_from_snapshot(snapshot)
+            if market_id and market_id not in market_ids:
+                market_ids.append(market_id)
+
+        if market_ids:
+            await self._evaluate_markets(market_ids)
+
+    async def _evaluate_markets(self, market_ids: List[str]) -> None:
+        """Run signal detection and execution for freshly updated markets."""
         if self.kill_switch and self.kill_switch.check_conditions():
             logger.critical("Kill switch triggered - halting execution")
             return
 
-        market = await self.order_book.get_market(market_id)
-        if not market:
-            return
+        for market_id in market_ids:
+            market = self.order_book.get_market(market_id)
+            if not market:
+                continue
 
-        signal = self.signal_engine.evaluate(market)
+            signal = self.signal_engine.evaluate(market)
 
-        self.ledger.log_opportunity(signal)
+            self.ledger.log_opportunity(signal)
 
-        if signal.is_tradeable and self.executor and not self.executor.is_halted:
-            logger.info(f"Trade signal for {market_id}: edge={signal.edge:.4f}")
-            result = await self.executor.execute_signal(signal, market)
-            if result.success:
-                logger.info(f"Trade executed successfully: tradeset_id={result.tradeset_id}")
-            else:
-                logger.warning(f"Trade failed: {result.error}")
+            if signal.is_tradeable and self.executor and not self.executor.is_halted:
+                logger.info(f"Trade signal for {market_id}: edge={signal.edge:.4f}")
+                result = await self.executor.execute_signal(
+                    signal, market, return_orders=False
+                )
+                if result.success:
+                    logger.info(f"Trade executed successfully: tradeset_id={result.tradeset_id}")
+                else:
+                    logger.warning(f"Trade failed: {result.error}")
 
     async def run_forever(self) -> None:
         """Run the bot until shutdown."""
@@ -157,7 +196,7 @@ async def run_bot(config: Config) -> None:
     """Main entry point to run the bot."""
     bot = ArbBot(config)
 
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
     
     def signal_handler():
         logger.info("Received shutdown signal")
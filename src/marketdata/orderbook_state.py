@@ -1,16 +1,15 @@
 """
 Order book state management - tracks best bid/ask for YES and NO tokens.
 """
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from decimal import Decimal
 from typing import Dict, Optional, List
 from datetime import datetime
-import asyncio
 
 from src.adapters.base import OrderBookSnapshot, BookLevel
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TokenBook:
     token_id: str
     best_bid_price: Optional[Decimal] = None
@@ -21,7 +20,7 @@ class TokenBook:
     sequence: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MarketBook:
     market_id: str
     question: str
@@ -66,15 +65,16 @@ class MarketBook:
 class OrderBookState:
     """
     Manages order book state for multiple markets.
-    Thread-safe updates via asyncio locks.
+    Written only from the event loop and never awaited mid-update, so no
+    lock is needed. Books are immutable: updates store a new MarketBook,
+    so callers can hold on to the one they got.
     """
 
     def __init__(self):
         self._markets: Dict[str, MarketBook] = {}
         self._token_to_market: Dict[str, str] = {}
-        self._lock = asyncio.Lock()
 
-    async def register_market(
+    def register_market(
         self,
         market_id: str,
         question: str,
@@ -82,122 +82,62 @@ class OrderBookState:
         no_token_id: str,
     ) -> None:
         """Register a new market to track."""
-        async with self._lock:
-            self._markets[market_id] = MarketBook(
-                market_id=market_id,
-                question=question,
-                yes_token=TokenBook(token_id=yes_token_id),
-                no_token=TokenBook(token_id=no_token_id),
-            )
-            self._token_to_market[yes_token_id] = market_id
-            self._token_to_market[no_token_id] = market_id
-
-    async def update_from_snapshot(self, snapshot: OrderBookSnapshot) -> Optional[str]:
+        self._markets[market_id] = MarketBook(
+            market_id=market_id,
+            question=question,
+            yes_token=TokenBook(token_id=yes_token_id),
+            no_token=TokenBook(token_id=no_token_id),
+        )
+        self._token_to_market[yes_token_id] = market_id
+        self._token_to_market[no_token_id] = market_id
+
+    def update_from_snapshot(self, snapshot: OrderBookSnapshot) -> Optional[str]:
         """
         Update order book state from a snapshot.
         Returns the market_id if update was successful, None otherwise.
         """
-        async with self._lock:
-            market_id = self._token_to_market.get(snapshot.token_id)
-            if market_id is None:
-                return None
-
-            market = self._markets.get(market_id)
-            if market is None:
-                return None
-
-            if snapshot.token_id == market.yes_token.token_id:
-                token = market.yes_token
-            elif snapshot.token_id == market.no_token.token_id:
-                token = market.no_token
-            else:
-                return None
-
-            if snapshot.asks:
-                best_ask = snapshot.asks[0]
-                token.best_ask_price = best_ask.price
-                token.best_ask_size = best_ask.size
-            else:
-                token.best_ask_price = None
-                token.best_ask_size = None
-
-            if snapshot.bids:
-                best_bid = snapshot.bids[0]
-                token.best_bid_price = best_bid.price
-                token.best_bid_size = best_bid.size
-            else:
-                token.best_bid_price = None
-                token.best_bid_size = None
-
-            token.last_update = snapshot.timestamp
-            token.sequence = snapshot.sequence
-
-            return market_id
-
-    async def get_market(self, market_id: str) -> Optional[MarketBook]:
+        market_id = self._token_to_market.get(snapshot.token_id)
+        if market_id is None:
+            return None
+
+        market = self._markets.get(market_id)
+        if market is None:
+            return None
+
+        is_yes = snapshot.token_id == market.yes_token.token_id
+        if not is_yes and snapshot.token_id != market.no_token.token_id:
+            return None
+
+        best_ask = snapshot.asks[0] if snapshot.asks else None
+        best_bid = snapshot.bids[0] if snapshot.bids else None
+        token = TokenBook(
+            token_id=snapshot.token_id,
+            best_bid_price=best_bid.price if best_bid else None,
+            best_bid_size=best_bid.size if best_bid else None,
+            best_ask_price=best_ask.price if best_ask else None,
+            best_ask_size=best_ask.size if best_ask else None,
+            last_update=snapshot.timestamp,
+            sequence=snapshot.sequence,
+        )
+
+        if is_yes:
+            self._markets[market_id] = replace(market, yes_token=token)
+        else:
+            self._markets[market_id] = replace(market, no_token=token)
+
+        return market_id
+
+    def get_market(self, market_id: str) -> Optional[MarketBook]:
         """Get current state of a market."""
-        async with self._lock:
-            market = self._markets.get(market_id)
-            if market is None:
-                return None
-            return MarketBook(
-                market_id=market.market_id,
-                question=market.question,
-                yes_token=TokenBook(
-                    token_id=market.yes_token.token_id,
-                    best_bid_price=market.yes_token.best_bid_price,
-                    best_bid_size=market.yes_token.best_bid_size,
-                    best_ask_price=market.yes_token.best_ask_price,
-                    best_ask_size=market.yes_token.best_ask_size,
-                    last_update=market.yes_token.last_update,
-                    sequence=market.yes_token.sequence,
-                ),
-                no_token=TokenBook(
-                    token_id=market.no_token.token_id,
-                    best_bid_price=market.no_token.best_bid_price,
-                    best_bid_size=market.no_token.best_bid_size,
-                    best_ask_price=market.no_token.best_ask_price,
-                    best_ask_size=market.no_token.best_ask_size,
-                    last_update=market.no_token.last_update,
-                    sequence=market.no_token.sequence,
-                ),
-                active=market.active,
-            )
-
-    async def get_all_markets(self) -> List[MarketBook]:
+        return self._markets.get(market_id)
+
+    def get_all_markets(self) -> List[MarketBook]:
         """Get current state of all markets."""
-        async with self._lock:
-            return [
-                MarketBook(
-                    market_id=m.market_id,
-                    question=m.question,
-                    yes_token=TokenBook(
-                        token_id=m.yes_token.token_id,
-                        best_bid_price=m.yes_token.best_bid_price,
-                        best_bid_size=m.yes_token.best_bid_size,
-                        best_ask_price=m.yes_token.best_ask_price,
-                        best_ask_size=m.yes_token.best_ask_size,
-                        last_update=m.yes_token.last_update,
-                        sequence=m.yes_token.sequence,
-                    ),
-                    no_token=TokenBook(
-                        token_id=m.no_token.token_id,
-                        best_bid_price=m.no_token.best_bid_price,
-                        best_bid_size=m.no_token.best_bid_size,
-                        best_ask_price=m.no_token.best_ask_price,
-                        best_ask_size=m.no_token.best_ask_size,
-                        last_update=m.no_token.last_update,
-                        sequence=m.no_token.sequence,
-                    ),
-                    active=m.active,
-                )
-                for m in self._markets.values()
-            ]
-
-    async def get_token_ids(self) -> List[str]:
+        return list(self._markets.values())
+
+    def get_token_ids(self) -> List[str]:
         """Get all tracked token IDs for WebSocket subscription."""
-        async with self._lock:
-            return list(self._token_to_market.keys())
+        return list(self._token_to_market.keys())
 
     @property
     def market_count(self) -> int:
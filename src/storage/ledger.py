@@ -3,14 +3,24 @@ SQLite ledger for auditability and trade history.
 """
 import sqlite3
 import json
+import logging
+import time
+from contextlib import contextmanager
 from decimal import Decimal
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, Sequence, Tuple
 from dataclasses import asdict
 
 from src.strategy.signal_engine import TradeSignal, SignalDecision
 
+logger = logging.getLogger(__name__)
+
+RISK_COUNTS_TTL = 60.0
+OPPORTUNITY_FLUSH_ROWS = 100
+OPPORTUNITY_FLUSH_SECONDS = 1.0
+OPPORTUNITY_FLUSH_ATTEMPTS = 3
+
 
 class Ledger:
     """
@@ -21,18 +31,40 @@ class Ledger:
     def __init__(self, db_path: str = "arb_ledger.db"):
         self.db_path = db_path
         self._conn: Optional[sqlite3.Connection] = None
+        self._tx_depth = 0
+        self._risk_counts_cache: Dict[int, Tuple[float, Dict[str, int]]] = {}
+        self._pending_opportunities: List[Tuple[Any, ...]] = []
+        self._flush_failures = 0
 
     def connect(self) -> None:
         """Initialize database connection and create tables."""
         self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
         self._conn.row_factory = sqlite3.Row
+        self._configure_connection()
         self._create_tables()
+        self._conn.execute("PRAGMA optimize")
 
     def close(self) -> None:
         """Close database connection."""
         if self._conn:
-            self._conn.close()
-            self._conn = None
+            try:
+                self.flush()
+                self._conn.execute("PRAGMA optimize")
+            finally:
+                self._conn.close()
+                self._conn = None
+
+    def _configure_connection(self) -> None:
+        """
+        Tune SQLite for a single bot writer with concurrent dashboard readers.
+        WAL lets readers proceed while the bot writes; NORMAL sync is durable
+        across application crashes in WAL mode.
+        """
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA mmap_size=268435456")
+        self._conn.execute("PRAGMA cache_size=-65536")
 
     def _create_tables(self) -> None:
         """Create all required tables if they don't exist."""
@@ -124,9 +156,20 @@ class Ledger:
             CREATE INDEX IF NOT EXISTS idx_opportunities_market 
             ON opportunities(market_id)
         """)
+        cursor.execute("DROP INDEX IF EXISTS idx_opportunities_timestamp")
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_opportunities_recent
+            ON opportunities(timestamp DESC, market_id, decision, yes_ask,
+                             no_ask, sum_cost, edge, reason)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_tradesets_created
+            ON tradesets(created_at DESC)
+        """)
+        cursor.execute("DROP INDEX IF EXISTS idx_risk_events_created")
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_opportunities_timestamp 
-            ON opportunities(timestamp)
+            CREATE INDEX IF NOT EXISTS idx_risk_events_created_type
+            ON risk_events(created_at, event_type)
         """)
         cursor.execute("""
             CREATE INDEX IF NOT EXISTS idx_orders_tradeset 
@@ -139,15 +182,41 @@ class Ledger:
 
         self._conn.commit()
 
-    def log_opportunity(self, signal: TradeSignal) -> int:
-        """Log a detected opportunity (whether traded or skipped)."""
-        cursor = self._conn.cursor()
-        cursor.execute("""
-            INSERT INTO opportunities 
-            (market_id, timestamp, yes_ask, no_ask, yes_size, no_size, 
-             sum_cost, edge, cost_buffer, decision, reason)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Group several writes into a single commit. Nested blocks join the
+        outermost one; an exception rolls the whole group back.
+        """
+        self._tx_depth += 1
+        try:
+            yield
+        except BaseException:
+            self._tx_depth -= 1
+            self._rollback()
+            raise
+        self._tx_depth -= 1
+        if self._tx_depth == 0:
+            self._conn.commit()
+
+    def _commit(self) -> None:
+        """Commit now unless a transaction() block will commit for us."""
+        if self._tx_depth == 0:
+            self._conn.commit()
+
+    def _rollback(self) -> None:
+        """Undo uncommitted writes unless a transaction() block owns them."""
+        if self._tx_depth == 0:
+            self._conn.rollback()
+            self._risk_counts_cache.clear()
+
+    def log_opportunity(self, signal: TradeSignal) -> None:
+        """
+        Log a detected opportunity (whether traded or skipped). Rows are
+        buffered and written in batches of OPPORTUNITY_FLUSH_ROWS; long-running
+        writers should also call flush() every OPPORTUNITY_FLUSH_SECONDS.
+        """
+        self._pending_opportunities.append((
             signal.market_id,
             signal.timestamp,
             float(signal.yes_ask) if signal.yes_ask else None,
@@ -160,8 +229,43 @@ class Ledger:
             signal.decision.value,
             signal.reason,
         ))
-        self._conn.commit()
-        return cursor.lastrowid
+
+        if len(self._pending_opportunities) >= OPPORTUNITY_FLUSH_ROWS:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Write buffered opportunities in a single batch. A failed insert is
+        rolled back and the error re-raised; the batch is kept for the next
+        flush, and dropped after OPPORTUNITY_FLUSH_ATTEMPTS failures in a row.
+        """
+        rows = self._pending_opportunities
+        if not rows:
+            return
+
+        cursor = self._conn.cursor()
+        try:
+            cursor.executemany("""
+                INSERT INTO opportunities 
+                (market_id, timestamp, yes_ask, no_ask, yes_size, no_size, 
+                 sum_cost, edge, cost_buffer, decision, reason)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+        except sqlite3.Error:
+            self._rollback()
+            self._flush_failures += 1
+            if self._flush_failures >= OPPORTUNITY_FLUSH_ATTEMPTS:
+                logger.error(
+                    f"Dropping {len(rows)} buffered opportunities after "
+                    f"{self._flush_failures} failed flushes"
+                )
+                self._pending_opportunities = []
+                self._flush_failures = 0
+            raise
+
+        self._pending_opportunities = []
+        self._flush_failures = 0
+        self._commit()
 
     def create_tradeset(self, market_id: str) -> int:
         """Create a new tradeset for a complete-set trade attempt."""
@@ -170,7 +274,7 @@ class Ledger:
             INSERT INTO tradesets (market_id, status)
             VALUES (?, 'pending')
         """, (market_id,))
-        self._conn.commit()
+        self._commit()
         return cursor.lastrowid
 
     def update_tradeset(
@@ -227,7 +331,7 @@ class Ledger:
                 UPDATE tradesets SET {', '.join(updates)}
                 WHERE id = ?
             """, params)
-            self._conn.commit()
+            self._commit()
 
     def log_order(
         self,
@@ -259,7 +363,32 @@ class Ledger:
             float(size),
             status,
         ))
-        self._conn.commit()
+        self._commit()
+
+    def log_orders(
+        self,
+        orders: Sequence[Tuple[str, int, str, str, str, str, Decimal, Decimal, str]],
+    ) -> None:
+        """
+        Log several placed orders in one statement. Each row carries the same
+        fields as log_order(), in the same order.
+        """
+        if not orders:
+            return
+
+        cursor = self._conn.cursor()
+        cursor.executemany("""
+            INSERT INTO orders 
+            (order_id, tradeset_id, market_id, token_id, side, order_type, 
+             price, size, status)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, [
+            (order_id, tradeset_id, market_id, token_id, side, order_type,
+             float(price), float(size), status)
+            for (order_id, tradeset_id, market_id, token_id, side, order_type,
+                 price, size, status) in orders
+        ])
+        self._commit()
 
     def update_order(
         self,
@@ -296,7 +425,7 @@ class Ledger:
                 UPDATE orders SET {', '.join(updates)}
                 WHERE order_id = ?
             """, params)
-            self._conn.commit()
+            self._commit()
 
     def log_fill(
         self,
@@ -313,7 +442,7 @@ class Ledger:
             INSERT INTO fills (fill_id, order_id, price, size, fee, timestamp)
             VALUES (?, ?, ?, ?, ?, ?)
         """, (fill_id, order_id, float(price), float(size), float(fee), timestamp))
-        self._conn.commit()
+        self._commit()
 
     def log_risk_event(
         self,
@@ -323,14 +452,23 @@ class Ledger:
     ) -> None:
         """Log a risk event (partial fill, reject, disconnect, etc.)."""
         cursor = self._conn.cursor()
-        cursor.execute("""
-            INSERT INTO risk_events (event_type, market_id, details)
-            VALUES (?, ?, ?)
-        """, (event_type, market_id, json.dumps(details) if details else None))
-        self._conn.commit()
+        try:
+            cursor.execute("""
+                INSERT INTO risk_events (event_type, market_id, details)
+                VALUES (?, ?, ?)
+            """, (event_type, market_id, json.dumps(details) if details else None))
+            self._commit()
+        except sqlite3.Error:
+            self._rollback()
+            raise
+
+        # A new event falls inside every cached window, so count it in place
+        for _, counts in self._risk_counts_cache.values():
+            counts[event_type] = counts.get(event_type, 0) + 1
 
     def get_opportunities_summary(self) -> Dict[str, Any]:
         """Get summary statistics for opportunities."""
+        self.flush()
         cursor = self._conn.cursor()
 
         cursor.execute("SELECT COUNT(*) FROM opportunities")
@@ -402,7 +540,18 @@ class Ledger:
         }
 
     def get_risk_events_count(self, hours: int = 1) -> Dict[str, int]:
-        """Get count of risk events in the last N hours."""
+        """
+        Get count of risk events in the last N hours. Results are reused for
+        RISK_COUNTS_TTL seconds, since the kill switch asks on every book update;
+        events logged in the meantime are added to the cached counts. Events
+        that age out of the window keep counting until the next refresh, so
+        counts can run high by up to RISK_COUNTS_TTL seconds' worth of expiries.
+        """
+        now = time.monotonic()
+        cached = self._risk_counts_cache.get(hours)
+        if cached and now - cached[0] < RISK_COUNTS_TTL:
+            return dict(cached[1])
+
         cursor = self._conn.cursor()
         cursor.execute("""
             SELECT event_type, COUNT(*) as count
@@ -410,4 +559,64 @@ class Ledger:
             WHERE created_at > datetime('now', ?)
             GROUP BY event_type
         """, (f'-{hours} hours',))
-        return {row['event_type']: row['count'] for row in cursor.fetchall()}
+        counts = {row['event_type']: row['count'] for row in cursor.fetchall()}
+        self._risk_counts_cache[hours] = (now, counts)
+        return dict(counts)
+
+    def get_dashboard_snapshot(self, hours: int = 24) -> Dict[str, Any]:
+        """
+        Get opportunity, tradeset and risk-event summaries in one query.
+        Returns the same shapes as the individual summary methods.
+        """
+        self.flush()
+        cursor = self._conn.cursor()
+        cursor.execute("""
+            SELECT 'decision' AS tag, decision AS key, COUNT(*) AS value
+            FROM opportunities GROUP BY decision
+            UNION ALL
+            SELECT 'avg_edge', NULL, AVG(edge) FROM opportunities
+            UNION ALL
+            SELECT 'avg_sum_cost', NULL, AVG(sum_cost) FROM opportunities
+            UNION ALL
+            SELECT 'status', status, COUNT(*) FROM tradesets GROUP BY status
+            UNION ALL
+            SELECT 'total_pnl', NULL, SUM(realized_pnl) FROM tradesets
+            UNION ALL
+            SELECT 'total_fees', NULL, SUM(total_fees) FROM tradesets
+            UNION ALL
+            SELECT 'risk', event_type, COUNT(*)
+            FROM risk_events
+            WHERE created_at > datetime('now', ?)
+            GROUP BY event_type
+        """, (f'-{hours} hours',))
+
+        grouped: Dict[str, Dict[str, Any]] = {'decision': {}, 'status': {}, 'risk': {}}
+        scalars: Dict[str, Any] = {}
+        for row in cursor.fetchall():
+            if row['tag'] in grouped:
+                grouped[row['tag']][row['key']] = row['value']
+            else:
+                scalars[row['tag']] = row['value']
+
+        by_decision = grouped['decision']
+        total = sum(by_decision.values())
+        traded = by_decision.get(SignalDecision.TRADE.value, 0)
+        by_status = grouped['status']
+
+        return {
+            'opportunities': {
+                'total_opportunities': total,
+                'traded': traded,
+                'skipped': total - traded,
+                'avg_edge': scalars.get('avg_edge'),
+                'avg_sum_cost': scalars.get('avg_sum_cost'),
+                'by_decision': by_decision,
+            },
+            'tradesets': {
+                'total_tradesets': sum(by_status.values()),
+                'by_status': by_status,
+                'total_pnl': scalars.get('total_pnl') or 0,
+                'total_fees': scalars.get('total_fees') or 0,
+            },
+            'risk_events': grouped['risk'],
+        }
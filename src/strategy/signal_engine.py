@@ -3,6 +3,7 @@ Signal engine for complete-set arbitrage opportunity detection.
 """
 from dataclasses import dataclass
 from decimal import Decimal
+import time
 from typing import Optional, List
 from datetime import datetime
 from enum import Enum
@@ -10,6 +11,8 @@ from enum import Enum
 from src.marketdata.orderbook_state import MarketBook
 from src.config import StrategyConfig
 
+ONE_DOLLAR = Decimal("1.00")
+
 
 class SignalDecision(Enum):
     TRADE = "TRADE"
@@ -56,12 +59,38 @@ class SignalEngine:
         self._cooldowns: dict[str, float] = {}
         self._in_flight: set[str] = set()
 
+    def _make_signal(
+        self,
+        market: MarketBook,
+        now: float,
+        decision: SignalDecision,
+        reason: str,
+        sum_cost: Optional[Decimal] = None,
+        edge: Optional[Decimal] = None,
+    ) -> TradeSignal:
+        """Build a TradeSignal carrying the market's current top-of-book quotes."""
+        yes_token = market.yes_token
+        no_token = market.no_token
+        return TradeSignal(
+            market_id=market.market_id,
+            timestamp=now,
+            decision=decision,
+            yes_ask=yes_token.best_ask_price,
+            no_ask=no_token.best_ask_price,
+            yes_size=yes_token.best_ask_size,
+            no_size=no_token.best_ask_size,
+            sum_cost=sum_cost,
+            edge=edge,
+            cost_buffer=self.config.cost_buffer,
+            reason=reason,
+        )
+
     def evaluate(self, market: MarketBook) -> TradeSignal:
         """
         Evaluate a market for arbitrage opportunity.
         Returns a TradeSignal indicating whether to trade and why.
         """
-        now = datetime.now().timestamp()
+        now = time.time()
 
         if not market.active:
             return TradeSignal(
@@ -79,98 +108,52 @@ class SignalEngine:
             )
 
         if not market.has_valid_quotes:
-            return TradeSignal(
-                market_id=market.market_id,
-                timestamp=now,
-                decision=SignalDecision.SKIP_NO_QUOTES,
-                yes_ask=market.yes_token.best_ask_price,
-                no_ask=market.no_token.best_ask_price,
-                yes_size=market.yes_token.best_ask_size,
-                no_size=market.no_token.best_ask_size,
-                sum_cost=None,
-                edge=None,
-                cost_buffer=self.config.cost_buffer,
-                reason="Missing quotes for one or both tokens",
+            return self._make_signal(
+                market, now, SignalDecision.SKIP_NO_QUOTES,
+                "Missing quotes for one or both tokens",
             )
 
         if market.market_id in self._in_flight:
-            return TradeSignal(
-                market_id=market.market_id,
-                timestamp=now,
-                decision=SignalDecision.SKIP_IN_FLIGHT,
-                yes_ask=market.yes_token.best_ask_price,
-                no_ask=market.no_token.best_ask_price,
-                yes_size=market.yes_token.best_ask_size,
-                no_size=market.no_token.best_ask_size,
+            return self._make_signal(
+                market, now, SignalDecision.SKIP_IN_FLIGHT,
+                "Orders currently in flight",
                 sum_cost=market.sum_ask_cost,
-                edge=None,
-                cost_buffer=self.config.cost_buffer,
-                reason="Orders currently in flight",
             )
 
         cooldown_until = self._cooldowns.get(market.market_id, 0)
         if now < cooldown_until:
-            return TradeSignal(
-                market_id=market.market_id,
-                timestamp=now,
-                decision=SignalDecision.SKIP_IN_COOLDOWN,
-                yes_ask=market.yes_token.best_ask_price,
-                no_ask=market.no_token.best_ask_price,
-                yes_size=market.yes_token.best_ask_size,
-                no_size=market.no_token.best_ask_size,
+            return self._make_signal(
+                market, now, SignalDecision.SKIP_IN_COOLDOWN,
+                f"In cooldown until {datetime.fromtimestamp(cooldown_until).isoformat()}",
                 sum_cost=market.sum_ask_cost,
-                edge=None,
-                cost_buffer=self.config.cost_buffer,
-                reason=f"In cooldown until {datetime.fromtimestamp(cooldown_until).isoformat()}",
             )
 
         sum_cost = market.sum_ask_cost
         total_fee = sum_cost * self.fee_rate
-        edge = Decimal("1.00") - sum_cost - total_fee - self.config.cost_buffer
+        edge = ONE_DOLLAR - sum_cost - total_fee - self.config.cost_buffer
 
         if edge < self.config.min_edge:
-            return TradeSignal(
-                market_id=market.market_id,
-                timestamp=now,
-                decision=SignalDecision.SKIP_INSUFFICIENT_EDGE,
-                yes_ask=market.yes_token.best_ask_price,
-                no_ask=market.no_token.best_ask_price,
-                yes_size=market.yes_token.best_ask_size,
-                no_size=market.no_token.best_ask_size,
+            return self._make_signal(
+                market, now, SignalDecision.SKIP_INSUFFICIENT_EDGE,
+                f"Edge {edge:.4f} < min_edge {self.config.min_edge}",
                 sum_cost=sum_cost,
                 edge=edge,
-                cost_buffer=self.config.cost_buffer,
-                reason=f"Edge {edge:.4f} < min_edge {self.config.min_edge}",
             )
 
         min_size = market.min_available_size
         if min_size < self.config.min_depth:
-            return TradeSignal(
-                market_id=market.market_id,
-                timestamp=now,
-                decision=SignalDecision.SKIP_INSUFFICIENT_DEPTH,
-                yes_ask=market.yes_token.best_ask_price,
-                no_ask=market.no_token.best_ask_price,
-                yes_size=market.yes_token.best_ask_size,
-                no_size=market.no_token.best_ask_size,
+            return self._make_signal(
+                market, now, SignalDecision.SKIP_INSUFFICIENT_DEPTH,
+                f"Min depth {min_size:.2f} < required {self.config.min_depth}",
                 sum_cost=sum_cost,
                 edge=edge,
-                cost_buffer=self.config.cost_buffer,
-                reason=f"Min depth {min_size:.2f} < required {self.config.min_depth}",
             )
 
-        return TradeSignal(
-            market_id=market.market_id,
-            timestamp=now,
-            decision=SignalDecision.TRADE,
-            yes_ask=market.yes_token.best_ask_price,
-            no_ask=market.no_token.best_ask_price,
-            yes_size=market.yes_token.best_ask_size,
-            no_size=market.no_token.best_ask_size,
+        return self._make_signal(
+            market, now, SignalDecision.TRADE,
+            f"Opportunity detected: edge={edge:.4f}, depth={min_size:.2f}",
             sum_cost=sum_cost,
             edge=edge,
-            cost_buffer=self.config.cost_buffer,
-            reason=f"Opportunity detected: edge={edge:.4f}, depth={min_size:.2f}",
         )
 
     def set_in_flight(self, market_id: str) -> None:
@@ -183,7 +166,7 @@ class SignalEngine:
 
     def set_cooldown(self, market_id: str, duration_seconds: float) -> None:
         """Set a cooldown period for a market."""
-        self._cooldowns[market_id] = datetime.now().timestamp() + duration_seconds
+        self._cooldowns[market_id] = time.time() + duration_seconds
 
     def clear_cooldown(self, market_id: str) -> None:
         """Clear cooldown for a market."""